@@ -3,28 +3,74 @@ Flask Backend API for Naukri Scraper
 Provides REST API endpoints for the Angular frontend
 """
 
-from flask import Flask, request, jsonify, send_from_directory
-from flask_cors import CORS
-import json
+from flask import Flask, Response, request, jsonify, send_from_directory
+from flask.json.provider import DefaultJSONProvider
+from flask_compress import Compress
+import atexit
+import copy
+import msgspec
+import multiprocessing
+import orjson
 import os
 import sys
 import subprocess
 import threading
 import time
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Annotated, Literal
+
+# Project root holds config.json, the results file and the scraper modules
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CONFIG_PATH = os.path.join(BASE_DIR, 'config.json')
+RESULTS_PATH = os.path.join(BASE_DIR, 'scrapped_job_details.json')
 
 # Add parent directory to path to import naukri_scraper and batch_scraper
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(BASE_DIR)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson (used by jsonify and request.get_json)"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
-try:
-    import batch_scraper
-except ImportError:
-    # Fallback if running from root
-    sys.path.append(os.getcwd())
-    import batch_scraper
 
 app = Flask(__name__)
-CORS(app)  # Enable CORS for Angular frontend
+app.json = OrjsonProvider(app)
+Compress(app)  # gzip responses on the fly
+
+
+# CORS for the Angular frontend: fixed headers instead of flask-cors' per-request
+# origin matching. Preflight OPTIONS requests are answered by Flask's automatic
+# OPTIONS handling and pick these headers up here too.
+_CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET,POST,OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type'
+}
+
+
+@app.after_request
+def add_cors_headers(response):
+    """Attach the CORS headers to every response"""
+    response.headers.update(_CORS_HEADERS)
+    return response
+
+
+class ScrapeRequest(msgspec.Struct):
+    """Request body for POST /api/scrape"""
+    keyword: Annotated[str, msgspec.Meta(min_length=1)]
+    location: Annotated[str, msgspec.Meta(min_length=1)]
+    experience: int
+    max_jobs: int
+    sort_by: Literal['date', 'relevance']
+    freshness: Literal[1, 3, 7, 15, 30]
+
 
 # Global variable to track scraping status
 scraping_status = {
@@ -35,136 +81,271 @@ scraping_status = {
     'error': None
 }
 
-def run_scraper(config_data):
-    """Run the scraper in a separate thread"""
-    global scraping_status
+# Scrape jobs run one at a time on this executor; its internal queue holds
+# pending submissions. _status_lock guards every write of scraping_status.
+_executor = ThreadPoolExecutor(max_workers=1)
+_status_lock = threading.RLock()
+
+# Immutable (version, serialized status) snapshot. Writers replace it with a
+# single assignment, so readers can take it without the lock and never see a
+# half-updated status; _status_changed wakes SSE clients on each publish.
+_status_changed = threading.Condition(_status_lock)
+_status_snapshot = (0, orjson.dumps(scraping_status))
+
+
+def _publish_status():
+    """Swap in a new status snapshot and notify stream listeners (call with _status_lock held)"""
+    global _status_snapshot
+    _status_snapshot = (_status_snapshot[0] + 1, orjson.dumps(scraping_status))
+    _status_changed.notify_all()
+
+# Parsed config.json as one (mtime, data) tuple, swapped whole so readers
+# never see an mtime paired with another version's data; reused until the
+# file's mtime changes
+_config_cache = (0, None)
+
+# Pre-encoded response bodies: (the _config_cache tuple it encodes, bytes)
+# and [monotonic time, bytes]
+_config_response = (None, b'')
+_health_cache = [0.0, b'']
+
+
+def get_config_cached(path):
+    """Return (mtime, parsed config), re-reading the file only when its mtime changes"""
+    global _config_cache
+    cached = _config_cache
+    st = os.stat(path)
+    if st.st_mtime != cached[0]:
+        with open(path, 'rb') as f:
+            cached = (st.st_mtime, orjson.loads(f.read()))
+        _config_cache = cached
+    return cached
+
+# Selenium/Chrome live in a separate long-lived worker process so the API
+# process stays small and a browser crash can't take it down. Started lazily
+# on the first scrape (spawn, since this process is multi-threaded).
+_mp = multiprocessing.get_context('spawn')
+_job_queue = None
+_result_queue = None
+_worker = None
+
+
+def _scrape_worker_loop(job_q, result_q):
+    """Worker process: run each queued config and report None or the error text
+
+    One NaukriScraper (and its Chrome) is kept across jobs and reset between
+    them; it is only recreated if the headless or detail_workers setting
+    changes or a job fails.
+    """
+    import atexit
+    import traceback
+    try:
+        import batch_scraper
+    except ImportError:
+        # Fallback if running from root
+        sys.path.append(os.getcwd())
+        import batch_scraper
+    
+    scraper = None
+    options = None
     
+    def close_scraper():
+        nonlocal scraper
+        if scraper is not None:
+            try:
+                scraper.close()
+            except Exception:
+                pass
+            scraper = None
+    
+    atexit.register(close_scraper)
+    
+    try:
+        while True:
+            config = job_q.get()
+            if config is None:
+                break
+            try:
+                settings = config.get('scraper_settings', {})
+                wanted = (settings.get('headless', False), settings.get('detail_workers', 1))
+                if scraper is not None and wanted != options:
+                    close_scraper()
+                if scraper is None:
+                    scraper = batch_scraper.NaukriScraper(headless=wanted[0], detail_workers=wanted[1])
+                    options = wanted
+                else:
+                    scraper.reset()
+                batch_scraper.run_scraping(config=config, scraper=scraper)
+                result_q.put(None)
+            except BaseException as e:
+                traceback.print_exc()
+                # The browser may be in a bad state; start fresh next time
+                close_scraper()
+                result_q.put(str(e) or type(e).__name__)
+    finally:
+        close_scraper()
+
+
+def _ensure_worker():
+    """Start the scraper worker process, or restart it if it has died"""
+    global _job_queue, _result_queue, _worker
+    if _worker is None or not _worker.is_alive():
+        _job_queue = _mp.Queue()
+        _result_queue = _mp.Queue()
+        _worker = _mp.Process(target=_scrape_worker_loop, args=(_job_queue, _result_queue), daemon=True)
+        _worker.start()
+
+
+def _stop_worker(timeout=15):
+    """At exit, let the worker finish its job and close Chrome; terminate it only if it doesn't in time"""
+    if _worker is None or not _worker.is_alive():
+        return
+    _job_queue.put(None)
+    _worker.join(timeout)
+    if _worker.is_alive():
+        _worker.terminate()
+        _worker.join()
+
+# Registered after multiprocessing's own exit handler, so it runs first
+# (that one would terminate the daemon worker before it could clean up)
+atexit.register(_stop_worker)
+
+
+def run_scraper(req):
+    """Update config and run a scrape in the worker process (runs on the background executor)"""
+    global _config_cache
     try:
-        scraping_status['state'] = 'running'
-        scraping_status['progress'] = 10
-        scraping_status['message'] = 'Initializing scraper...'
-        scraping_status['last_updated'] = datetime.now().isoformat()
-        scraping_status['error'] = None
+        ts = datetime.now().isoformat()
+        with _status_lock:
+            scraping_status.update({
+                'state': 'running',
+                'progress': 10,
+                'message': 'Initializing scraper...',
+                'last_updated': ts,
+                'error': None
+            })
+            _publish_status()
         
         # Update config.json with new parameters
-        config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config.json')
-        
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        # Work on a copy so the cache never holds unsaved edits
+        config = copy.deepcopy(get_config_cached(CONFIG_PATH)[1])
         
         # Update job_search parameters
-        config['job_search']['keyword'] = config_data['keyword']
-        config['job_search']['location'] = config_data['location']
-        config['job_search']['experience'] = int(config_data['experience'])
-        config['job_search']['max_jobs'] = int(config_data['max_jobs'])
-        config['job_search']['sort_by'] = config_data['sort_by']
-        config['job_search']['freshness'] = int(config_data['freshness'])
-        
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=4)
-        
-        scraping_status['progress'] = 30
-        scraping_status['message'] = 'Configuration updated. Starting scraper...'
-        scraping_status['last_updated'] = datetime.now().isoformat()
-        
-        scraping_status['progress'] = 50
-        scraping_status['message'] = 'Scraping jobs from Naukri.com...'
-        scraping_status['last_updated'] = datetime.now().isoformat()
-        
-        # Execute the scraper directly
-        # We reload to ensure fresh config is picked up if the module caches it
-        import importlib
-        importlib.reload(batch_scraper)
-        
-        print("DEBUG: Calling batch_scraper.run_scraping()...")
-        # Run the scraping function
-        batch_scraper.run_scraping()
-        print("DEBUG: batch_scraper.run_scraping() returned.")
-        
-        scraping_status['progress'] = 100
-        scraping_status['state'] = 'completed'
-        scraping_status['message'] = 'Scraping completed successfully!'
-        scraping_status['last_updated'] = datetime.now().isoformat()
+        config['job_search']['keyword'] = req.keyword
+        config['job_search']['location'] = req.location
+        config['job_search']['experience'] = req.experience
+        config['job_search']['max_jobs'] = req.max_jobs
+        config['job_search']['sort_by'] = req.sort_by
+        config['job_search']['freshness'] = req.freshness
+        
+        # Serialize in memory, then hand it to the OS in a single write
+        with open(CONFIG_PATH, 'wb', buffering=65536) as f:
+            f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+        
+        # We just wrote it, so refresh the cache without re-reading
+        _config_cache = (os.stat(CONFIG_PATH).st_mtime, config)
+        
+        ts = datetime.now().isoformat()
+        with _status_lock:
+            scraping_status.update({
+                'progress': 30,
+                'message': 'Configuration updated. Starting scraper...',
+                'last_updated': ts
+            })
+            _publish_status()
+        
+        ts = datetime.now().isoformat()
+        with _status_lock:
+            scraping_status.update({
+                'progress': 50,
+                'message': 'Scraping jobs from Naukri.com...',
+                'last_updated': ts
+            })
+            _publish_status()
+        
+        # Hand the config to the worker process and wait for it to finish
+        _ensure_worker()
+        _job_queue.put(config)
+        while True:
+            try:
+                error = _result_queue.get(timeout=5)
+                break
+            except queue.Empty:
+                if not _worker.is_alive():
+                    raise RuntimeError('Scraper worker exited unexpectedly')
+        if error is not None:
+            raise RuntimeError(error)
+        
+        ts = datetime.now().isoformat()
+        with _status_lock:
+            scraping_status.update({
+                'progress': 100,
+                'state': 'completed',
+                'message': 'Scraping completed successfully!',
+                'last_updated': ts
+            })
+            _publish_status()
         
     except BaseException as e:
         print(f"Scraping error (caught BaseException): {str(e)}")
         import traceback
         traceback.print_exc()
         
-        scraping_status['progress'] = 0
-        scraping_status['state'] = 'failed'
-        scraping_status['message'] = f'Error: {str(e)}'
-        scraping_status['error'] = str(e)
-        scraping_status['last_updated'] = datetime.now().isoformat()
+        ts = datetime.now().isoformat()
+        with _status_lock:
+            scraping_status.update({
+                'progress': 0,
+                'state': 'failed',
+                'message': f'Error: {str(e)}',
+                'error': str(e),
+                'last_updated': ts
+            })
+            _publish_status()
 
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({'status': 'ok', 'timestamp': datetime.now().isoformat()})
+    now = time.monotonic()
+    if now - _health_cache[0] > 1.0:
+        _health_cache[0] = now
+        _health_cache[1] = orjson.dumps({'status': 'ok', 'timestamp': datetime.now().isoformat()})
+    return Response(_health_cache[1], mimetype='application/json')
 
 
 @app.route('/api/scrape', methods=['POST'])
 def start_scraping():
     """Start the scraping process"""
-    global scraping_status
-    
-    if scraping_status['state'] == 'running':
-        return jsonify({
-            'success': False,
-            'message': 'Scraping is already in progress'
-        }), 400
-    
     try:
-        data = request.get_json()
-        
-        # Validate required fields
-        required_fields = ['keyword', 'location', 'experience', 'max_jobs', 'sort_by', 'freshness']
-        for field in required_fields:
-            if field not in data or data[field] == '':
-                return jsonify({
-                    'success': False,
-                    'message': f'Missing required field: {field}'
-                }), 400
-        
-        # Validate numeric fields
+        # Decode and validate in one compiled pass; strict=False keeps
+        # accepting numeric strings like "4" as the old int() checks did
         try:
-            int(data['experience'])
-            int(data['max_jobs'])
-            int(data['freshness'])
-        except ValueError:
-            return jsonify({
-                'success': False,
-                'message': 'Experience, max_jobs, and freshness must be valid numbers'
-            }), 400
-        
-        # Validate sort_by
-        if data['sort_by'] not in ['date', 'relevance']:
+            req = msgspec.json.decode(request.get_data(), type=ScrapeRequest, strict=False)
+        except msgspec.DecodeError as e:  # also covers ValidationError
             return jsonify({
                 'success': False,
-                'message': 'sort_by must be either "date" or "relevance"'
+                'message': str(e)
             }), 400
         
-        # Validate freshness
-        if int(data['freshness']) not in [1, 3, 7, 15, 30]:
-            return jsonify({
-                'success': False,
-                'message': 'freshness must be one of: 1, 3, 7, 15, 30'
-            }), 400
-        
-        # Reset status
-        scraping_status = {
-            'state': 'running',
-            'progress': 0,
-            'message': 'Starting scraper...',
-            'last_updated': datetime.now().isoformat(),
-            'error': None
-        }
+        # Check-and-reset under the lock so two requests can't both start a scrape
+        with _status_lock:
+            if scraping_status['state'] == 'running':
+                return jsonify({
+                    'success': False,
+                    'message': 'Scraping is already in progress'
+                }), 400
+            
+            scraping_status.update({
+                'state': 'running',
+                'progress': 0,
+                'message': 'Starting scraper...',
+                'last_updated': datetime.now().isoformat(),
+                'error': None
+            })
+            _publish_status()
         
-        # Start scraping in background thread
-        thread = threading.Thread(target=run_scraper, args=(data,))
-        thread.daemon = True
-        thread.start()
+        # Queue the scrape on the single-worker executor
+        _executor.submit(run_scraper, req)
         
         return jsonify({
             'success': True,
@@ -181,28 +362,82 @@ def start_scraping():
 @app.route('/api/status', methods=['GET'])
 def get_status():
     """Get current scraping status"""
-    return jsonify(scraping_status)
+    return Response(_status_snapshot[1], mimetype='application/json')
+
+
+@app.route('/api/status/stream', methods=['GET'])
+def stream_status():
+    """Push scraping status as Server-Sent Events whenever it changes"""
+    def generate():
+        seen = -1
+        while True:
+            with _status_changed:
+                # Re-send the current status every 30s as a keep-alive
+                _status_changed.wait_for(lambda: _status_snapshot[0] != seen, timeout=30)
+            seen, payload = _status_snapshot
+            yield b'data: ' + payload + b'\n\n'
+    
+    return Response(generate(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 
 @app.route('/api/results', methods=['GET'])
 def get_results():
     """Get scraped job results"""
     try:
-        results_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'scrapped_job_details.json')
-        
-        if not os.path.exists(results_path):
+        # The results file already is the payload 'data', so stream its raw
+        # bytes inside the envelope instead of parsing and re-serializing it.
+        # Plain reads rather than mmap: save_to_json rewrites the file in
+        # place, which would SIGBUS a mapping that is still being streamed
+        # (and on Windows an open mapping makes that save fail).
+        try:
+            f = open(RESULTS_PATH, 'rb')
+        except FileNotFoundError:
             return jsonify({
                 'success': False,
                 'message': 'No results found. Please run a scrape first.'
             }), 404
         
-        with open(results_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        return jsonify({
-            'success': True,
-            'data': data
-        })
+        # The file is closed when the streamed response finishes, or here if
+        # no stream is returned
+        streaming = False
+        try:
+            st = os.fstat(f.fileno())
+            size = st.st_size
+            # Weak ETag so Flask-Compress leaves it untouched when gzipping
+            etag = f'{st.st_mtime_ns:x}-{size:x}'
+            if request.if_none_match.contains_weak(etag):
+                response = Response(status=304)
+                response.set_etag(etag, weak=True)
+                return response
+            if size == 0:
+                # Not valid JSON; nothing has been saved yet
+                return jsonify({'success': True, 'data': []})
+            
+            prefix = b'{"success":true,"data":'
+            suffix = b'}'
+            
+            def generate():
+                yield prefix
+                # Never send more than the Content-Length promised, even if the file grew
+                remaining = size
+                while remaining > 0:
+                    chunk = f.read(min(65536, remaining))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    yield chunk
+                yield suffix
+            
+            response = Response(generate(), mimetype='application/json',
+                                headers={'Content-Length': str(len(prefix) + size + len(suffix))})
+            response.set_etag(etag, weak=True)
+            response.call_on_close(f.close)
+            streaming = True
+            return response
+        finally:
+            if not streaming:
+                f.close()
         
     except Exception as e:
         return jsonify({
@@ -211,19 +446,35 @@ def get_results():
         }), 500
 
 
+@app.route('/api/results/file', methods=['GET'])
+def get_results_file():
+    """Download the raw results file (no envelope), letting the WSGI server use sendfile if it can"""
+    if not os.path.exists(RESULTS_PATH):
+        return jsonify({
+            'success': False,
+            'message': 'No results found. Please run a scrape first.'
+        }), 404
+    
+    return send_from_directory(BASE_DIR,
+                               os.path.basename(RESULTS_PATH),
+                               mimetype='application/json')
+
+
 @app.route('/api/config', methods=['GET'])
 def get_config():
     """Get current configuration"""
     try:
-        config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config.json')
+        global _config_response
+        cached = get_config_cached(CONFIG_PATH)
         
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        # Keyed on the exact tuple the data came from, so a concurrent refresh
+        # can't pair a new mtime with old bytes
+        response = _config_response
+        if response[0] is not cached:
+            response = (cached, orjson.dumps({'success': True, 'data': cached[1]}))
+            _config_response = response
         
-        return jsonify({
-            'success': True,
-            'data': config
-        })
+        return Response(response[1], mimetype='application/json')
         
     except Exception as e:
         return jsonify({
@@ -241,8 +492,17 @@ if __name__ == '__main__':
     print("  GET  /api/health   - Health check")
     print("  POST /api/scrape   - Start scraping")
     print("  GET  /api/status   - Get scraping status")
+    print("  GET  /api/status/stream - Scraping status as Server-Sent Events")
     print("  GET  /api/results  - Get scraped results")
+    print("  GET  /api/results/file - Raw results file (sendfile under gunicorn)")
     print("  GET  /api/config   - Get current config")
     print("=" * 70)
     
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    if os.environ.get('FLASK_DEV'):
+        app.run(debug=True, host='0.0.0.0', port=5000)
+    else:
+        # Werkzeug's server is for development only; for real use run e.g.
+        #   gunicorn -w 1 -k gthread --threads 16 -b 0.0.0.0:5000 backend.app:app   (one worker: status is per process)
+        #   waitress-serve --listen=0.0.0.0:5000 backend.app:app   (Windows)
+        print("Tip: set FLASK_DEV=1 for debug/reload, or run under gunicorn/waitress")
+        app.run(host='0.0.0.0', port=5000, threaded=True)
@@ -6,28 +6,41 @@ Run job scraping based on config.json configuration
 import json
 import os
 from datetime import datetime
+from functools import lru_cache
+from typing import Optional
 from naukri_scraper import NaukriScraper
 
 
-def load_config(config_file: str = 'config.json') -> dict:
-    """Load configuration from JSON file"""
+@lru_cache(maxsize=8)
+def _load_config_cached(config_file: str, mtime: float) -> dict:
+    """Parse the config file; cached per (path, mtime) so edits are picked up"""
     with open(config_file, 'r', encoding='utf-8') as f:
         return json.load(f)
 
 
-def run_scraping(config_file: str = 'config.json'):
+def load_config(config_file: str = 'config.json') -> dict:
+    """Load configuration from JSON file"""
+    return _load_config_cached(config_file, os.stat(config_file).st_mtime)
+
+
+def run_scraping(config: Optional[dict] = None, config_file: str = 'config.json',
+                 scraper: Optional[NaukriScraper] = None):
     """
     Run scraping based on configuration file
     
     Args:
+        config (dict): Already-loaded configuration; read from config_file if None
         config_file (str): Path to configuration file
+        scraper (NaukriScraper): Existing scraper to reuse; the caller keeps
+            ownership and it is not closed here. A new one is created if None.
     """
     print("=" * 70)
     print("Naukri.com Job Scraper - Config Mode")
     print("=" * 70)
     
     # Load configuration
-    config = load_config(config_file)
+    if config is None:
+        config = load_config(config_file)
     job_search = config.get('job_search', {})
     scraper_settings = config.get('scraper_settings', {})
     
@@ -50,8 +63,11 @@ def run_scraping(config_file: str = 'config.json'):
     print(f"  Headless Mode: {'Yes' if scraper_settings.get('headless', False) else 'No'}")
     print("=" * 70 + "\n")
     
-    # Initialize scraper
-    scraper = NaukriScraper(headless=scraper_settings.get('headless', False))
+    # Initialize scraper (unless the caller supplied a warm one)
+    owns_scraper = scraper is None
+    if owns_scraper:
+        scraper = NaukriScraper(headless=scraper_settings.get('headless', False),
+                                detail_workers=scraper_settings.get('detail_workers', 1))
     
     try:
         # Run scraping
@@ -62,7 +78,10 @@ def run_scraping(config_file: str = 'config.json'):
             max_jobs=job_search.get('max_jobs', 100),
             deep_scrape=scraper_settings.get('deep_scrape', False),
             sort_by=job_search.get('sort_by', 'date'),
-            freshness=job_search.get('freshness', 1)
+            freshness=job_search.get('freshness', 1),
+            workers=scraper_settings.get('workers', 1),
+            mode=scraper_settings.get('mode', 'selenium'),
+            tabs=scraper_settings.get('tabs', 1)
         )
         
         
@@ -81,7 +100,8 @@ def run_scraping(config_file: str = 'config.json'):
         print("=" * 70)
         
     finally:
-        scraper.close()
+        if owns_scraper:
+            scraper.close()
 
 
 if __name__ == "__main__":
@@ -3,50 +3,443 @@ Naukri.com Job Scraper
 A custom web scraper to extract job listings from Naukri.com
 """
 
-import time
 import json
 import logging
+import queue
+import threading
+import atexit
 import re
 import argparse
+import math
+import multiprocessing
+import multiprocessing.util
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Optional
+from functools import lru_cache
+from operator import itemgetter
+from typing import TYPE_CHECKING, List, Dict, Optional
+from urllib.parse import quote, urlencode, urljoin, urlsplit, urlunsplit
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+# Selenium is imported on first use (see _import_selenium), so --help and
+# argument errors return without paying for it
+if TYPE_CHECKING:
+    import asyncio
+    from selenium import webdriver
+webdriver = By = WebDriverWait = EC = Options = None
+TimeoutException = NoSuchElementException = None
+
+try:
+    import orjson
+except ImportError:  # Falls back to stdlib json
+    orjson = None
+
+# The plain-HTTP paths' dependencies (asyncio, aiohttp, lxml, selectolax) are
+# imported on first use as well (see _import_http); aiohttp alone is most of
+# this module's import time
+asyncio = aiohttp = etree = lxml_html = LexborHTMLParser = None
+_http_imported = False
+
+# jobAge values accepted by Naukri's search
+VALID_FRESHNESS = frozenset((1, 3, 7, 15, 30))
+
+# Numeric job id at the end of a job details URL
+_TRAILING_DIGITS_RE = re.compile(r'(\d+)$')
+
+# First number in a card's tuple id or posted-date label ("3 Days Ago")
+_DIGITS_RE = re.compile(r'(\d+)')
+
+# Posted-date phrases with a fixed age in days, checked in order
+# ('today' has to match before the generic "N days" handling)
+_UNIT_DAYS = {
+    'just now': -0.2,
+    'few hours': -0.1,
+    'today': 0,
+    'hour': 0,
+    'month': 30,
+}
+
+# "N days/weeks ago" labels: days per unit (N defaults to 1)
+_UNIT_MULTIPLIERS = (('day', 1), ('week', 7))
+
+
+def _parse_days_ago(posted: str) -> float:
+    """Approximate age in days of a posted-date label; 999 if unknown (sorts last)"""
+    posted = posted.lower()
+    if not posted or posted == 'n/a':
+        return 999
+    for token, days_ago in _UNIT_DAYS.items():
+        if token in posted:
+            return days_ago
+    for unit, unit_days in _UNIT_MULTIPLIERS:
+        if unit in posted:
+            match = _DIGITS_RE.search(posted)
+            return (int(match.group(1)) if match else 1) * unit_days
+    return 999
+
+# Sets window.__naukri_stable once job cards exist and their count has held
+# for 300ms, so Python waits on one flag instead of polling the card list.
+# Mutations that don't change the card count (ads, carousels) are ignored.
+CARDS_STABLE_SCRIPT = """
+window.__naukri_stable = false;
+let last = -1, timer = null;
+const check = () => {
+    const count = document.querySelectorAll('.srp-jobtuple-wrapper, .cust-job-tuple').length;
+    if (count === last) return;
+    last = count;
+    clearTimeout(timer);
+    timer = setTimeout(() => { if (last > 0) window.__naukri_stable = true; }, 300);
+};
+new MutationObserver(check).observe(document.body, {childList: true, subtree: true});
+check();
+"""
+
+# Background thread writing log records (see NaukriScraper.setup_logging)
+_log_listener = None
+
+# Job cards Naukri shows per results page
+JOBS_PER_PAGE = 20
+
+# Job details loaded in one tab before it is replaced by a fresh one
+DETAIL_TAB_MAX_USES = 200
+
+BASE_URL = 'https://www.naukri.com'
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Values of the search URL's sort parameter
+SORT_CODES = {'date': 'f', 'relevance': 'r'}
+
+# Text of the results page's 'Sort by' control (e.g. "Sort by: Date"), or null
+SORT_LABEL_SCRIPT = """
+const label = document.evaluate("//*[contains(text(), 'Sort by')]", document, null,
+                                XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+    || document.querySelector('.sort-droopdown, .sort-label');
+return label ? (label.parentElement || label).innerText : null;
+"""
+
+# The selected sort in that text: the first word after "Sort by" (or the
+# first word, for the class-matched fallback element)
+_SORT_VALUE_RE = re.compile(r'^\s*(?:sort\s*by\s*:?\s*)?(\w+)', re.IGNORECASE)
+
+
+def _selected_sort(label: str) -> Optional[str]:
+    """The sort shown in a 'Sort by' label's text, lowercased ('date', 'relevance'); None if unreadable"""
+    match = _SORT_VALUE_RE.match(label)
+    return match.group(1).lower() if match else None
+
+# Third-party ad/analytics/tracker requests Chrome is told not to make
+BLOCKED_URL_PATTERNS = [
+    '*doubleclick.net*',
+    '*googlesyndication.com*',
+    '*googletagmanager.com*',
+    '*google-analytics.com*',
+    '*adservice.google.*',
+    '*adsystem*',
+    '*facebook.net*',
+    '*facebook.com/tr*',
+    '*hotjar.com*',
+    '*clarity.ms*',
+]
+
+# Sub-resources only needed for rendering (images, fonts), blocked along
+# with the above when block_resources is on. Stylesheets stay: lazy loading
+# on scroll, is_displayed() on 'Read More' and the sort label's innerText
+# all depend on real layout.
+RESOURCE_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+]
+
+# JSON search API behind Naukri's results pages, and the client headers it expects
+SEARCH_API_URL = 'https://www.naukri.com/jobapi/v3/search'
+SEARCH_API_HEADERS = {
+    'User-Agent': USER_AGENT,
+    'Accept': 'application/json',
+    'appid': '109',
+    'systemid': 'Naukri',
+    'clientid': 'd3skt0p',
+}
+
+# Job description containers on a job details page, in priority order
+DESCRIPTION_SELECTORS = [
+    '.styles_JDC__dang-inner-html__h0K4t',
+    '.job-description',
+    '.jd-description',
+    '[class*="job-description"]',
+    '[class*="description"]',
+    '.styles_job-desc',
+]
+
+# The same containers for the plain-HTTP path
+DESCRIPTION_XPATHS = [
+    '//*[contains(@class, "styles_JDC__dang-inner-html")]',
+    '//*[contains(@class, "job-description")]',
+    '//*[contains(@class, "jd-description")]',
+    '//*[contains(@class, "description")]',
+]
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching elements that carry the CSS class `name`"""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
+# Job card fields in a results page's server-rendered HTML (the plain-HTTP
+# counterpart of JOB_CARDS_SCRIPT): CSS selectors for selectolax, and the
+# same lookups as XPaths compiled once for the lxml fallback
+_CARD_SELECTOR = '.srp-jobtuple-wrapper, .cust-job-tuple'
+_CARD_FIELD_SELECTORS = {
+    'company': 'a.comp-name, .company-name',
+    'experience': '.expwdth',
+    'salary': '.sal',
+    'location': '.locWdth',
+    'posted': '.job-post-day',
+    'description': '.job-desc',
+}
+
+_CARD_XPATH = _CARD_TITLE_XPATH = _CARD_FIELD_XPATHS = None  # Compiled by _import_http
+
+# Count the job cards and, if there are fewer than arguments[0], scroll to the
+# bottom to load more. Returns [card count, scrollHeight before scrolling].
+SCROLL_STEP_SCRIPT = """
+const count = document.querySelectorAll('.srp-jobtuple-wrapper, .cust-job-tuple').length;
+const height = document.body.scrollHeight;
+if (count < arguments[0]) window.scrollTo(0, height);
+return [count, height];
+"""
+
+# Snapshot the job cards on the results page in one WebDriver call, at most
+# arguments[0] of them (all if it is null). Missing fields come back as null.
+JOB_CARDS_SCRIPT = """
+const text = (card, sel) => { const e = card.querySelector(sel); return e ? e.innerText : null; };
+const cards = Array.from(document.querySelectorAll('.srp-jobtuple-wrapper, .cust-job-tuple'));
+return cards.slice(0, arguments[0] || undefined).map(card => {
+    const title = card.querySelector('a.title');
+    return {
+        jobId: card.getAttribute('data-job-id'),
+        tupleId: card.id,
+        title: title ? title.innerText : null,
+        href: title ? title.href : null,
+        company: text(card, 'a.comp-name') ?? text(card, '.company-name'),
+        experience: text(card, '.expwdth'),
+        salary: text(card, '.sal'),
+        location: text(card, '.locWdth'),
+        posted: text(card, '.job-post-day'),
+        description: text(card, '.job-desc')
+    };
+});
+"""
+
+
+def _import_selenium():
+    """Bind the Selenium names used by NaukriScraper; a no-op after the first call"""
+    global webdriver, By, WebDriverWait, EC, Options, TimeoutException, NoSuchElementException
+    if webdriver is not None:
+        return
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.chrome.options import Options
+    from selenium.common.exceptions import TimeoutException, NoSuchElementException
+
+
+def _import_http() -> bool:
+    """
+    Bind the plain-HTTP dependencies (None if not installed) and compile the
+    card XPaths; a no-op after the first call
+    
+    Returns:
+        bool: True if aiohttp and lxml are available
+    """
+    global asyncio, aiohttp, etree, lxml_html, LexborHTMLParser, _http_imported
+    global _CARD_XPATH, _CARD_TITLE_XPATH, _CARD_FIELD_XPATHS
+    if _http_imported:
+        return aiohttp is not None
+    import asyncio
+    try:
+        import aiohttp
+        from lxml import etree, html as lxml_html
+    except ImportError:  # Deep scrape falls back to Selenium for every job
+        aiohttp = None
+        lxml_html = None
+    
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+    except ImportError:  # Results page HTML is parsed with lxml instead
+        LexborHTMLParser = None
+    
+    if lxml_html is not None:
+        _CARD_XPATH = etree.XPath(f'//*[{_has_class("srp-jobtuple-wrapper")} or {_has_class("cust-job-tuple")}]')
+        _CARD_TITLE_XPATH = etree.XPath(f'.//a[{_has_class("title")}]')
+        _CARD_FIELD_XPATHS = {
+            'company': etree.XPath(f'.//a[{_has_class("comp-name")}] | .//*[{_has_class("company-name")}]'),
+            'experience': etree.XPath(f'.//*[{_has_class("expwdth")}]'),
+            'salary': etree.XPath(f'.//*[{_has_class("sal")}]'),
+            'location': etree.XPath(f'.//*[{_has_class("locWdth")}]'),
+            'posted': etree.XPath(f'.//*[{_has_class("job-post-day")}]'),
+            'description': etree.XPath(f'.//*[{_has_class("job-desc")}]'),
+        }
+    _http_imported = True
+    return aiohttp is not None
+
+
+# chromedriver process shared by every browser in this process (see _chromedriver_service)
+_chromedriver = None
+_chromedriver_lock = threading.Lock()
+
+
+def _chromedriver_service():
+    """
+    The chromedriver service every Chrome in this process is launched through
+    
+    webdriver.Chrome starts its service when a browser is created and stops it
+    on quit(); here start() only launches chromedriver the first time (or after
+    it died) and stop() is a no-op, so new browsers skip spawning and waiting
+    on a fresh chromedriver. The process is shut down at exit.
+    """
+    global _chromedriver
+    with _chromedriver_lock:
+        if _chromedriver is None:
+            from selenium.webdriver.chrome.service import Service
+            
+            class SharedService(Service):
+                def start(self):
+                    with _chromedriver_lock:
+                        process = getattr(self, 'process', None)
+                        if process is None or process.poll() is not None:
+                            super().start()
+                
+                def stop(self):
+                    pass
+                
+                def shutdown(self):
+                    # Nothing to stop if chromedriver never started (e.g. no Chrome installed)
+                    if getattr(self, 'process', None) is not None:
+                        super().stop()
+            
+            _chromedriver = SharedService()
+            atexit.register(_chromedriver.shutdown)
+        return _chromedriver
+
+
+class BrowserPool:
+    """Fixed set of warm Chrome instances, each handed to one caller at a time"""
+    
+    def __init__(self, factory, size: int = 4):
+        """
+        Start `size` browsers in parallel
+        
+        Args:
+            factory: Callable returning a new WebDriver
+            size (int): Number of browsers to keep
+        """
+        with ThreadPoolExecutor(max_workers=size) as executor:
+            futures = [executor.submit(factory) for _ in range(size)]
+        self._all = [f.result() for f in futures if f.exception() is None]
+        if not self._all:
+            raise futures[0].exception()
+        self._idle = queue.Queue()
+        for driver in self._all:
+            self._idle.put(driver)
+    
+    def __len__(self):
+        return len(self._all)
+    
+    @contextmanager
+    def driver(self):
+        """Check out an idle browser, blocking until one is free"""
+        driver = self._idle.get()
+        try:
+            yield driver
+        finally:
+            self._idle.put(driver)
+    
+    def close(self):
+        """Quit every browser in the pool"""
+        for driver in self._all:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        self._all = []
 
 
 class NaukriScraper:
     """Web scraper for Naukri.com job portal"""
     
-    def __init__(self, headless: bool = True):
+    def __init__(self, headless: bool = True, ndjson_path: Optional[str] = None,
+                 detail_workers: int = 1, block_resources: bool = True):
         """
         Initialize the Naukri scraper
         
         Args:
             headless (bool): Run browser in headless mode (no GUI)
+            ndjson_path (str): If set, append each job to this newline-delimited
+                JSON file as soon as it is extracted, so partial results survive
+                a crash or interrupt (see convert_ndjson_to_json)
+            detail_workers (int): Headless browsers used in parallel for deep-scrape
+                pages that can't be read over HTTP; 1 (default) uses a tab in the
+                main browser instead of starting extra Chromes
+            block_resources (bool): Don't download images or fonts; job cards
+                are read from the DOM, which doesn't need them
         """
-        self.base_url = "https://www.naukri.com"
+        _import_selenium()
+        self.base_url = BASE_URL
+        self.headless = headless
         self.jobs_data = []
+        self._detail_handle = None  # Reusable tab for job details pages
+        self._detail_uses = 0
+        self.detail_workers = detail_workers
+        self.block_resources = block_resources
+        self._browser_pool = None  # Started on first use (see fetch_job_details_in_browsers)
+        # Results pages are read over HTTP until one has no cards in its HTML (see _scrape_page);
+        # the session and its event loop are kept so those requests reuse connections
+        self._html_pages = True
+        self._http_loop = None
+        self._http_session = None
         self.setup_logging()
+        # Unbuffered: each job line reaches the file in one write as soon as it is extracted
+        self._ndjson_fp = open(ndjson_path, 'ab', buffering=0) if ndjson_path else None
         self.driver = self.setup_driver(headless)
+        # Shared explicit wait for page loads (cards not yet in the DOM are simply retried)
+        self.wait = WebDriverWait(self.driver, 10, poll_frequency=0.25,
+                                  ignored_exceptions=(NoSuchElementException,))
         
     def setup_logging(self):
-        """Configure logging for the scraper"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('naukri_scraper.log'),
-                logging.StreamHandler()
-            ]
-        )
+        """
+        Configure logging for the scraper
+        
+        Records go through a QueueHandler; a background QueueListener thread
+        does the file and console writes, so logging inside the scrape loop
+        never blocks on I/O. The listener is shared by all scrapers in the
+        process and flushed at exit.
+        """
+        global _log_listener
+        root = logging.getLogger()
+        if _log_listener is None and not root.handlers:
+            from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+            
+            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+            # Cap the log at ~20MB on disk across long or repeated scrapes
+            file_handler = RotatingFileHandler('naukri_scraper.log', maxBytes=5_000_000, backupCount=3,
+                                               encoding='utf-8')
+            stream_handler = logging.StreamHandler()
+            file_handler.setFormatter(formatter)
+            stream_handler.setFormatter(formatter)
+            
+            log_queue = queue.Queue(-1)
+            _log_listener = QueueListener(log_queue, file_handler, stream_handler)
+            _log_listener.start()
+            atexit.register(_log_listener.stop)
+            
+            root.setLevel(logging.INFO)
+            root.addHandler(QueueHandler(log_queue))
         self.logger = logging.getLogger(__name__)
         
-    def setup_driver(self, headless: bool) -> webdriver.Chrome:
+    def setup_driver(self, headless: bool) -> 'webdriver.Chrome':
         """
         Setup Chrome WebDriver with optimized options for scraping
         
@@ -58,6 +451,10 @@ class NaukriScraper:
         """
         chrome_options = Options()
         
+        # Return from driver.get() at DOMContentLoaded instead of waiting for
+        # every ad/analytics sub-resource; callers wait for the elements they need
+        chrome_options.page_load_strategy = 'eager'
+        
         # Headless mode
         if headless:
             chrome_options.add_argument('--headless')
@@ -88,6 +485,7 @@ class NaukriScraper:
         chrome_options.add_argument('--disable-popup-blocking')
         prefs = {
             'profile.default_content_setting_values.notifications': 2,  # Block notifications
+            'profile.managed_default_content_settings.images': 2,  # Don't download images (only card text is read)
             'profile.default_content_setting_values.popups': 0,  # Allow popups (for job links)
             'credentials_enable_service': False,  # Disable save password prompts
             'profile.password_manager_enabled': False  # Disable password manager
@@ -95,6 +493,7 @@ class NaukriScraper:
         chrome_options.add_experimental_option('prefs', prefs)
         
         # === PERFORMANCE & STABILITY ===
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
         chrome_options.add_argument('--disable-gpu')  # Disable GPU acceleration
@@ -102,168 +501,540 @@ class NaukriScraper:
         
         # === ANTI-DETECTION ===
         chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        chrome_options.add_argument(f'--user-agent={USER_AGENT}')
         
         self.logger.info("Launching Chrome WebDriver in incognito mode...")
-        driver = webdriver.Chrome(options=chrome_options)
+        driver = webdriver.Chrome(service=_chromedriver_service(), options=chrome_options)
         driver.maximize_window()
+        # Never block on missing elements; every wait in the scraper is explicit
+        driver.implicitly_wait(0)
+        
+        self._block_urls(driver)
+        
+        # Drop caches Chrome doesn't need for scraping before the first page
+        try:
+            driver.execute_cdp_cmd('Memory.prepareForLeakDetection', {})
+        except Exception as e:
+            self.logger.debug("Could not trim browser caches: %s", e)
         
         return driver
     
-    def build_search_url(self, 
-                        keyword: str, 
-                        location: str = "", 
-                        experience: int = 0,
-                        salary: str = "",
-                        freshness: int = 1) -> str:
+    def _block_urls(self, driver):
+        """
+        Skip ad/analytics scripts entirely (and rendering-only resources if
+        block_resources is on) in driver's current tab; they only cost
+        bandwidth and renderer CPU
+        
+        The block list is per tab, so this runs again for every tab opened.
+        """
+        blocked = BLOCKED_URL_PATTERNS + RESOURCE_URL_PATTERNS if self.block_resources else BLOCKED_URL_PATTERNS
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked})
+        except Exception as e:
+            self.logger.debug("Could not block URLs: %s", e)
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def build_search_url(keyword: str, 
+                         location: str = "", 
+                         experience: int = 0,
+                         salary: str = "",
+                         freshness: int = 1,
+                         sort_by: Optional[str] = None) -> str:
         """
         Build search URL with query parameters (matches Naukri's official search format)
         
+        Cached per search; the URL is for the first results page, later pages
+        append &page=N to it.
+        
         Args:
             keyword (str): Job title or keyword (supports comma-separated values)
             location (str): Job location (supports comma-separated values)
             experience (int): Experience in years (e.g., 4 for 4 years, 0 for any experience)
             salary (str): Salary range
             freshness (int): Filter jobs posted within last N days (1, 3, 7, 15, 30)
+            sort_by (str): 'date' or 'relevance' (Naukri's default order if None)
             
         Returns:
             str: Formatted search URL with query parameters
         """
-        from urllib.parse import quote
-        
         # Build base URL path (still uses hyphenated format for SEO-friendly URL)
-        search_url = f"{self.base_url}/{keyword.replace(' ', '-').lower()}-jobs"
-        
+        path = f"/{keyword.replace(' ', '-').lower()}-jobs"
         if location:
-            search_url += f"-in-{location.replace(' ', '-').lower()}"
+            path += f"-in-{location.replace(' ', '-').lower()}"
         
-        # Build query parameters (Naukri's official format)
-        params = []
+        # Query parameters in Naukri's official format (keyword/location are
+        # lowercase and may hold several comma-separated values); unset ones are dropped
+        params = {
+            'k': keyword.lower(),
+            'l': location.lower(),
+            'experience': experience if experience and experience > 0 else None,
+            'jobAge': freshness if freshness in VALID_FRESHNESS else None,
+            'salary': salary,
+            'sort': SORT_CODES.get(sort_by),
+        }
+        query = urlencode({k: v for k, v in params.items() if v}, quote_via=quote)
+        
+        scheme, netloc = urlsplit(BASE_URL)[:2]
+        return urlunsplit((scheme, netloc, path, query, ''))
+    
+    def fetch_job_details(self, job_urls: List[str], concurrency: int = 10) -> Dict[str, Dict[str, str]]:
+        """
+        Fetch job details pages concurrently over plain HTTP (no browser)
         
-        # Add keyword parameter (supports multiple comma-separated values)
-        # Use lowercase to match Naukri's format
-        params.append(f"k={quote(keyword.lower())}")
+        Uses the browser's cookies so requests look like the same session.
+        Pages whose description isn't in the server-rendered HTML are left
+        out, so the caller can fall back to get_apply_link for those.
         
-        # Add location parameter (supports multiple comma-separated values)
-        if location:
-            params.append(f"l={quote(location.lower())}")
+        Args:
+            job_urls (List[str]): URLs of job details pages
+            concurrency (int): Maximum requests in flight
+            
+        Returns:
+            Dict: job_url -> same shape as get_apply_link's result
+        """
+        if not job_urls or not _import_http():
+            return {}
+        
+        cookies = {c['name']: c['value'] for c in self.driver.get_cookies()}
+        
+        async def fetch_all():
+            sem = asyncio.Semaphore(concurrency)
+            timeout = aiohttp.ClientTimeout(total=15)
+            async with aiohttp.ClientSession(cookies=cookies, headers={'User-Agent': USER_AGENT},
+                                             timeout=timeout) as session:
+                # One bad page mustn't throw away the others' results
+                return await asyncio.gather(*[self._fetch_job_detail(session, url, sem) for url in job_urls],
+                                            return_exceptions=True)
+        
+        try:
+            results = asyncio.run(fetch_all())
+        except Exception as e:
+            self.logger.warning("HTTP prefetch of job details failed: %s", e)
+            return {}
+        
+        details = {}
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.debug("HTTP fetch of a job page failed: %s", result)
+            elif result[1]:
+                details[result[0]] = result[1]
+        self.logger.info("Fetched %s/%s job descriptions over HTTP", len(details), len(job_urls))
+        return details
+    
+    async def _fetch_job_detail(self, session, job_url: str, sem: 'asyncio.Semaphore'):
+        """Fetch one job page and pull its description out of the HTML"""
+        async with sem:
+            try:
+                async with session.get(job_url) as resp:
+                    if resp.status != 200:
+                        return job_url, None
+                    # Raw bytes: lxml picks up the page's charset itself, so a
+                    # wrong or missing header can't raise UnicodeDecodeError here
+                    body = await resp.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.logger.debug("HTTP fetch failed for %s: %s", job_url, e)
+                return job_url, None
+        
+        try:
+            tree = lxml_html.fromstring(body)
+        except Exception:
+            return job_url, None
+        
+        for xpath in DESCRIPTION_XPATHS:
+            for elem in tree.xpath(xpath):
+                full_desc = elem.text_content().strip()
+                if len(full_desc) > 50:
+                    return job_url, {
+                        'apply_link': job_url,
+                        'apply_type': 'naukri',
+                        'full_description': full_desc
+                    }
+        return job_url, None
+    
+    def scrape_via_api(self,
+                       keyword: str,
+                       location: str = "",
+                       experience: int = 0,
+                       max_jobs: int = 100,
+                       deep_scrape: bool = False,
+                       freshness: int = 1,
+                       sort_by: Optional[str] = None,
+                       concurrency: int = 5) -> List[Dict]:
+        """
+        Fetch search results from Naukri's JSON jobs API instead of rendering pages
+        
+        All result pages needed for max_jobs are requested concurrently. Returns
+        an empty list if aiohttp isn't installed or the API refuses the request
+        (e.g. it asks for a captcha), so the caller can fall back to the browser.
+        
+        Args:
+            keyword (str): Job search keyword
+            location (str): Job location
+            experience (int): Experience in years (0 for any)
+            max_jobs (int): Maximum number of jobs to fetch
+            deep_scrape (bool): If True, also fetch each job's full description
+            freshness (int): Filter jobs posted within last N days (1, 3, 7, 15, 30)
+            sort_by (str): 'date' or 'relevance' (the API's default order if None)
+            concurrency (int): Maximum requests in flight
+            
+        Returns:
+            List[Dict]: Jobs in the same shape as extract_job_info's
+        """
+        if not _import_http():
+            return []
         
-        # Add experience parameter (integer value in years)
+        params = {
+            'noOfResults': JOBS_PER_PAGE,
+            'urlType': 'search_by_key_loc' if location else 'search_by_keyword',
+            'searchType': 'adv',
+            'keyword': keyword.lower(),
+            'k': keyword.lower(),
+            'seoKey': f"{keyword.replace(' ', '-').lower()}-jobs",
+            'src': 'jobsearchDesk',
+        }
+        if location:
+            params['location'] = params['l'] = location.lower()
+            params['seoKey'] += f"-in-{location.replace(' ', '-').lower()}"
         if experience and experience > 0:
-            params.append(f"experience={experience}")
+            params['experience'] = experience
+        if freshness in VALID_FRESHNESS:
+            params['jobAge'] = freshness
+        if sort_by in SORT_CODES:
+            params['sort'] = SORT_CODES[sort_by]
+        
+        pages = range(1, math.ceil(max_jobs / JOBS_PER_PAGE) + 1)
+        
+        async def fetch_all():
+            sem = asyncio.Semaphore(concurrency)
+            timeout = aiohttp.ClientTimeout(total=15)
+            async with aiohttp.ClientSession(headers=SEARCH_API_HEADERS, timeout=timeout) as session:
+                return await asyncio.gather(*[self._fetch_api_page(session, params, page, sem) for page in pages])
+        
+        try:
+            results = asyncio.run(fetch_all())
+        except Exception as e:
+            self.logger.warning("Jobs API request failed: %s", e)
+            return []
         
-        # Add freshness filter (jobAge parameter)
-        if freshness and freshness in [1, 3, 7, 15, 30]:
-            params.append(f"jobAge={freshness}")
+        # Stop at the first page the API refused or left empty
+        items = []
+        for page_items in results:
+            if not page_items:
+                break
+            items.extend(page_items)
+        items = items[:max_jobs]
+        
+        details = {}
+        if deep_scrape:
+            urls = [self.base_url + i['jdURL'] for i in items if i.get('jdURL')]
+            details = self.fetch_job_details(urls)
+            if self.detail_workers > 1:
+                # Anything the pool misses is loaded in the details tab by _api_job_info
+                try:
+                    details.update(self.fetch_job_details_in_browsers([u for u in urls if u not in details]))
+                except Exception as e:
+                    self.logger.warning("Parallel job details failed, using the details tab: %s", e)
+        
+        jobs = []
+        for idx, item in enumerate(items, 1):
+            try:
+                job_info = self._api_job_info(item, idx, deep_scrape=deep_scrape, details=details)
+                jobs.append(job_info)
+                if self._ndjson_fp:
+                    self._ndjson_fp.write(_ndjson_line(job_info))
+            except Exception as e:
+                self.logger.warning("Error reading API job %s: %s", idx, e)
+        
+        self.logger.info("Fetched %s jobs from the jobs API", len(jobs))
+        return jobs
+    
+    async def _fetch_api_page(self, session, params: Dict, page: int, sem: 'asyncio.Semaphore') -> List[Dict]:
+        """Fetch one page of search results from the jobs API; [] if it was refused"""
+        async with sem:
+            try:
+                async with session.get(SEARCH_API_URL, params={**params, 'pageNo': page}) as resp:
+                    if resp.status != 200:
+                        self.logger.debug("Jobs API returned HTTP %s for page %s", resp.status, page)
+                        return []
+                    body = await resp.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.logger.debug("Jobs API fetch failed for page %s: %s", page, e)
+                return []
+        
+        try:
+            data = orjson.loads(body) if orjson is not None else json.loads(body)
+        except ValueError:
+            return []
+        return data.get('jobDetails') or []
+    
+    def _api_job_info(self, item: Dict, index: int, deep_scrape: bool = False,
+                      details: Optional[Dict[str, Dict[str, str]]] = None) -> Dict:
+        """
+        Build job information from one jobs API result
         
-        # Add salary if provided
-        if salary:
-            params.append(f"salary={quote(salary)}")
+        Args:
+            item (Dict): Entry of the API's jobDetails list
+            index (int): Job index number
+            deep_scrape (bool): If True, use the job's full description
+            details (Dict): Job details already fetched over HTTP, keyed by URL
             
-        if params:
-            search_url += "?" + "&".join(params)
+        Returns:
+            Dict: Job information dictionary
+        """
+        placeholders = {p.get('type'): p.get('label') for p in item.get('placeholders') or []}
+        job_link = self.base_url + item['jdURL'] if item.get('jdURL') else None
+        
+        try:
+            job_id = int(item.get('jobId') or 0)
+        except ValueError:
+            job_id = 0
+        
+        job_data = {
+            'index': index,
+            'scraped_at': datetime.now().isoformat(),
+            'job_id': job_id,
+            'title': (item.get('title') or 'N/A').strip(),
+            'job_details_url': job_link,
+        }
         
-        return search_url
+        if deep_scrape and job_link:
+            apply_info = (details or {}).get(job_link) or self.get_apply_link(job_link)
+            job_data['apply_link'] = apply_info['apply_link']
+            job_data['apply_type'] = apply_info['apply_type']
+            job_data['description'] = apply_info.get('full_description', 'N/A')
+        else:
+            description = (item.get('jobDescription') or '').strip()
+            if description and lxml_html is not None:
+                # The API sends HTML; if it won't parse (e.g. only whitespace
+                # or comments), keep the raw text rather than lose the job
+                try:
+                    description = lxml_html.fromstring(description).text_content()
+                except Exception as e:
+                    self.logger.debug("Could not parse API job description: %s", e)
+            job_data['apply_link'] = job_link
+            job_data['apply_type'] = 'naukri'
+            job_data['description'] = description.strip() or 'N/A'
+        
+        job_data['company'] = item.get('companyName') or 'N/A'
+        job_data['experience'] = placeholders.get('experience') or 'N/A'
+        job_data['salary'] = placeholders.get('salary') or 'N/A'
+        job_data['location'] = placeholders.get('location') or 'N/A'
+        job_data['posted_date'] = item.get('footerPlaceholderLabel') or 'N/A'
+        
+        return job_data
     
-    def get_apply_link(self, job_url: str) -> Dict[str, str]:
+    def _http_fetch_page(self, url: str) -> List[Dict]:
         """
-        Visit job details page, click 'Read More' to expand full description, and extract it.
-        Does NOT click apply button.
+        Fetch a results page over plain HTTP and read its job cards from the HTML
+        
+        Returns the same card dicts as JOB_CARDS_SCRIPT (see _parse_job_cards),
+        or an empty list if aiohttp/lxml aren't installed, the request fails, or the cards are only
+        rendered client-side (the caller then loads the page in the browser).
+        """
+        if not _import_http():
+            return []
+        
+        cookies = {c['name']: c['value'] for c in self.driver.get_cookies()}
+        
+        async def fetch():
+            if self._http_session is None:
+                self._http_session = aiohttp.ClientSession(headers={'User-Agent': USER_AGENT},
+                                                           timeout=aiohttp.ClientTimeout(total=15))
+            async with self._http_session.get(url, cookies=cookies) as resp:
+                if resp.status != 200:
+                    return None
+                return await resp.read()
+        
+        try:
+            if self._http_loop is None:
+                self._http_loop = asyncio.new_event_loop()
+            body = self._http_loop.run_until_complete(fetch())
+            cards = _parse_job_cards(body, url) if body else []
+        except Exception as e:
+            self.logger.debug("HTTP fetch failed for %s: %s", url, e)
+            return []
+        
+        self.logger.info("Read %s job cards from the page HTML", len(cards))
+        return cards
+    
+    def _switch_to_detail_tab(self, original_window: str):
+        """
+        Switch to the tab used for job details pages, opening it on first use
+        
+        The tab is reused across jobs instead of opening and closing one per
+        job, and recreated every DETAIL_TAB_MAX_USES jobs so Chrome's
+        per-tab memory doesn't keep growing over a long scrape.
+        """
+        handles = self.driver.window_handles
+        if self._detail_handle in handles and self._detail_uses < DETAIL_TAB_MAX_USES:
+            self.driver.switch_to.window(self._detail_handle)
+        else:
+            if self._detail_handle in handles:
+                self.driver.switch_to.window(self._detail_handle)
+                self.driver.close()
+                self.driver.switch_to.window(original_window)
+            self.driver.switch_to.new_window('tab')
+            self._detail_handle = self.driver.current_window_handle
+            self._block_urls(self.driver)
+            self._detail_uses = 0
+        self._detail_uses += 1
+    
+    def fetch_job_details_in_browsers(self, job_urls: List[str]) -> Dict[str, Dict[str, str]]:
+        """
+        Load job details pages concurrently in a pool of headless browsers
+        
+        The pool (detail_workers browsers) is started on first use and kept
+        warm for the life of the scraper. If it can't be started, detail_workers
+        drops to 1 so later pages go straight to the main browser's tab.
         
         Args:
+            job_urls (List[str]): URLs of job details pages
+            
+        Returns:
+            Dict: job_url -> same shape as get_apply_link's result; pages that
+                failed (or all of them, if the pool couldn't start) are left out
+        """
+        if not job_urls:
+            return {}
+        
+        if self._browser_pool is None:
+            self.logger.info("Starting %s browsers for job details pages...", self.detail_workers)
+            try:
+                self._browser_pool = BrowserPool(lambda: self.setup_driver(headless=True), self.detail_workers)
+            except Exception as e:
+                self.logger.warning("Could not start detail browsers, using the details tab: %s", e)
+                self.detail_workers = 1
+                return {}
+        
+        def fetch(job_url):
+            with self._browser_pool.driver() as driver:
+                try:
+                    return job_url, self._read_job_details(driver, job_url)
+                except Exception as e:
+                    self.logger.warning("Error loading job details %s: %s", job_url, e)
+                    return job_url, None
+        
+        with ThreadPoolExecutor(max_workers=len(self._browser_pool)) as executor:
+            results = list(executor.map(fetch, job_urls))
+        
+        details = {url: info for url, info in results if info}
+        self.logger.info("Loaded %s/%s job details pages in parallel browsers", len(details), len(job_urls))
+        return details
+    
+    def _read_job_details(self, driver, job_url: str) -> Dict[str, str]:
+        """
+        Load a job details page in `driver`, expand 'Read More' and extract the description
+        
+        Args:
+            driver: WebDriver to load the page in (the scraper's own or a pooled one)
             job_url (str): URL of the job details page
             
         Returns:
             Dict: Dictionary with apply_link (same as job_url), apply_type, and full_description
         """
-        original_window = self.driver.current_window_handle
+        driver.get(job_url)
+        try:
+            WebDriverWait(driver, 10, poll_frequency=0.25).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, 'main'))
+            )
+        except TimeoutException:
+            self.logger.debug("Job page did not render in time: %s", job_url)
+        
+        result = {
+            'apply_link': job_url,
+            'apply_type': 'naukri',
+            'full_description': 'N/A'
+        }
         
+        # Click "Read More" button to expand full description
         try:
-            # Open job in new tab
-            self.driver.execute_script(f"window.open('{job_url}', '_blank');")
-            time.sleep(1)
-            
-            # Switch to new tab
-            new_window = [w for w in self.driver.window_handles if w != original_window][0]
-            self.driver.switch_to.window(new_window)
-            time.sleep(3)  # Wait for page to load
-            
-            result = {
-                'apply_link': job_url,
-                'apply_type': 'naukri',
-                'full_description': 'N/A'
-            }
+            # CSS equivalent of /html/body/div/div/main/div[2]/div[1]/section[2]/p/a
+            # (querySelector is cheaper than Chrome's XPath engine); JavaScript click
+            read_more_css = "body > div > div > main > div:nth-of-type(2) > div:nth-of-type(1) > section:nth-of-type(2) > p > a"
             
-            # Click "Read More" button to expand full description
-            try:
-                # Use the exact XPath and JavaScript click (like Sort by button)
-                read_more_xpath = "/html/body/div/div/main/div[2]/div[1]/section[2]/p/a"
+            read_more_btn = (driver.find_elements(By.CSS_SELECTOR, read_more_css) or [None])[0]
+            if read_more_btn is None:
+                self.logger.debug("No 'Read More' button found (description might already be full)")
+            elif read_more_btn.is_displayed():
+                # Highlight for debugging (optional)
+                driver.execute_script("arguments[0].style.border='2px solid blue'", read_more_btn)
                 
+                # Click using JavaScript to avoid navigation
+                driver.execute_script("arguments[0].click();", read_more_btn)
+                self.logger.debug("Clicked 'Read More' button")
+                # The button goes away once the description has expanded
                 try:
-                    read_more_btn = self.driver.find_element(By.XPATH, read_more_xpath)
-                    if read_more_btn and read_more_btn.is_displayed():
-                        # Highlight for debugging (optional)
-                        self.driver.execute_script("arguments[0].style.border='2px solid blue'", read_more_btn)
-                        time.sleep(0.5)
-                        
-                        # Click using JavaScript to avoid navigation
-                        self.driver.execute_script("arguments[0].click();", read_more_btn)
-                        self.logger.debug("Clicked 'Read More' button")
-                        time.sleep(2)  # Wait for description to expand
-                    else:
-                        self.logger.debug("Read More button not visible")
-                except NoSuchElementException:
-                    self.logger.debug("No 'Read More' button found (description might already be full)")
+                    WebDriverWait(driver, 2, poll_frequency=0.1).until(EC.invisibility_of_element(read_more_btn))
+                except TimeoutException:
+                    pass
+            else:
+                self.logger.debug("Read More button not visible")
+                
+        except Exception as e:
+            self.logger.debug("Error clicking 'Read More': %s", e)
+        
+        # Extract full job description (after expansion)
+        try:
+            # Wait once for any description container, then check the
+            # candidates in priority order without blocking on the missing ones
+            WebDriverWait(driver, 5).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, ', '.join(DESCRIPTION_SELECTORS)))
+            )
+            
+            for selector in DESCRIPTION_SELECTORS:
+                for desc_elem in driver.find_elements(By.CSS_SELECTOR, selector)[:1]:
+                    full_desc = desc_elem.text.strip()
+                    if full_desc and len(full_desc) > 50:
+                        result['full_description'] = full_desc
+                        self.logger.debug("Extracted description: %s characters", len(full_desc))
+                        break
+                if result['full_description'] != 'N/A':
+                    break
                     
-            except Exception as e:
-                self.logger.debug(f"Error clicking 'Read More': {str(e)}")
+        except TimeoutException:
+            self.logger.debug("No job description found on %s", job_url)
+        except Exception as e:
+            self.logger.debug("Could not extract full description: %s", e)
+        
+        return result
+    
+    def get_apply_link(self, job_url: str) -> Dict[str, str]:
+        """
+        Visit job details page, click 'Read More' to expand full description, and extract it.
+        Does NOT click apply button.
+        
+        Args:
+            job_url (str): URL of the job details page
             
-            # Extract full job description (after expansion)
-            try:
-                # Wait for description element to be present
-                wait = WebDriverWait(self.driver, 5)
-                
-                desc_selectors = [
-                    '.styles_JDC__dang-inner-html__h0K4t',
-                    '.job-description',
-                    '.jd-description',
-                    '[class*="job-description"]',
-                    '[class*="description"]',
-                    '.styles_job-desc',
-                ]
-                
-                for selector in desc_selectors:
-                    try:
-                        desc_elem = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-                        if desc_elem:
-                            full_desc = desc_elem.text.strip()
-                            if full_desc and len(full_desc) > 50:
-                                result['full_description'] = full_desc
-                                self.logger.debug(f"Extracted description: {len(full_desc)} characters")
-                                break
-                    except (NoSuchElementException, TimeoutException):
-                        continue
-                        
-            except Exception as e:
-                self.logger.debug(f"Could not extract full description: {str(e)}")
+        Returns:
+            Dict: Dictionary with apply_link (same as job_url), apply_type, and full_description
+        """
+        original_window = self.driver.current_window_handle
+        
+        try:
+            # Load the job in the reusable details tab
+            self._switch_to_detail_tab(original_window)
+            result = self._read_job_details(self.driver, job_url)
             
-            # Close the tab
-            self.driver.close()
+            # Leave the details tab open for the next job
             self.driver.switch_to.window(original_window)
             
             return result
                 
         except Exception as e:
-            # If anything goes wrong, close extra windows and return result
-            self.logger.warning(f"Error in get_apply_link: {str(e)}")
+            # If anything goes wrong, drop the details tab (other tabs, e.g. result
+            # pages loading in _scrape_pages_in_tabs, are left alone) and return result
+            self.logger.warning("Error in get_apply_link: %s", e)
             try:
-                for window in self.driver.window_handles:
-                    if window != original_window:
-                        self.driver.switch_to.window(window)
-                        self.driver.close()
+                if self._detail_handle in self.driver.window_handles:
+                    self.driver.switch_to.window(self._detail_handle)
+                    self.driver.close()
                 self.driver.switch_to.window(original_window)
             except:
                 pass
+            self._detail_handle = None
             
             return {
                 'apply_link': job_url,
@@ -271,18 +1042,24 @@ class NaukriScraper:
                 'full_description': 'N/A'
             }
     
-    def extract_job_info(self, card, index: int, deep_scrape: bool = False) -> Optional[Dict]:
+    def extract_job_info(self, card: Dict, index: int, deep_scrape: bool = False,
+                         details: Optional[Dict[str, Dict[str, str]]] = None) -> Optional[Dict]:
         """
-        Extract information from a single job card
+        Build job information from a single job card snapshot
         
         Args:
-            card: Selenium WebElement representing a job card
+            card (Dict): Card fields as returned by JOB_CARDS_SCRIPT
             index (int): Job index number
             deep_scrape (bool): If True, visit job page to get apply link
+            details (Dict): Job details already fetched over HTTP, keyed by URL
             
         Returns:
             Optional[Dict]: Job information dictionary
         """
+        def text(key: str) -> str:
+            value = card.get(key)
+            return value.strip() if value else "N/A"
+        
         job_data = {
             'index': index,
             'scraped_at': datetime.now().isoformat()
@@ -290,107 +1067,68 @@ class NaukriScraper:
         
         # Extract Job ID for sorting
         try:
-            job_id = card.get_attribute('data-job-id')
-            if job_id:
-                job_data['job_id'] = int(job_id)
-            else:
+            if card.get('jobId'):
+                job_data['job_id'] = int(card['jobId'])
+            elif card.get('tupleId'):
                 # Try to extract from tuple ID
-                tuple_id = card.get_attribute('id')
-                if tuple_id:
-                    job_data['job_id'] = int(''.join(filter(str.isdigit, tuple_id)))
-                else:
-                    job_data['job_id'] = 0
-        except:
+                match = _DIGITS_RE.search(card['tupleId'])
+                job_data['job_id'] = int(match.group(1)) if match else 0
+            else:
+                job_data['job_id'] = 0
+        except ValueError:
             job_data['job_id'] = 0
         
-        try:
-            # Job Title and Link
-            title_elem = card.find_element(By.CSS_SELECTOR, "a.title")
-            job_data['title'] = title_elem.text.strip()
-            
-            # Get the job link
-            job_link = title_elem.get_attribute('href')
-            if job_link and not job_link.startswith('http'):
-                job_link = self.base_url + job_link
-            
-            job_data['job_details_url'] = job_link
-            
-            # If we didn't get job_id from attribute, try from link
-            if job_data['job_id'] == 0 and job_link:
-                try:
-                    match = re.search(r'(\d+)$', job_link)
-                    if match:
-                        job_data['job_id'] = int(match.group(1))
-                except:
-                    pass
-            
-            # Deep scrape logic
-            if deep_scrape and job_link:
-                apply_info = self.get_apply_link(job_link)
-                job_data['apply_link'] = apply_info['apply_link']
-                job_data['apply_type'] = apply_info['apply_type']
-                job_data['description'] = apply_info.get('full_description', 'N/A')
-            else:
-                job_data['apply_link'] = job_link
-                job_data['apply_type'] = 'naukri'
-                try:
-                    desc_elem = card.find_element(By.CLASS_NAME, "job-desc")
-                    job_data['description'] = desc_elem.text.strip()
-                except NoSuchElementException:
-                    job_data['description'] = "N/A"
-            
-        except NoSuchElementException:
-            self.logger.warning(f"Could not find title/link for job {index}")
+        # Job Title and Link
+        if card.get('title') is None:
+            self.logger.warning("Could not find title/link for job %s", index)
             return None
         
-        # Company Name
-        try:
-            company_elem = card.find_element(By.CSS_SELECTOR, "a.comp-name")
-            job_data['company'] = company_elem.text.strip()
-        except NoSuchElementException:
-            try:
-                company_elem = card.find_element(By.CSS_SELECTOR, ".company-name")
-                job_data['company'] = company_elem.text.strip()
-            except:
-                job_data['company'] = "N/A"
+        job_data['title'] = card['title'].strip()
         
-        # Experience
-        try:
-            exp_elem = card.find_element(By.CLASS_NAME, "expwdth")
-            job_data['experience'] = exp_elem.text.strip()
-        except NoSuchElementException:
-            job_data['experience'] = "N/A"
-            
-        # Salary
-        try:
-            salary_elem = card.find_element(By.CLASS_NAME, "sal")
-            job_data['salary'] = salary_elem.text.strip()
-        except NoSuchElementException:
-            job_data['salary'] = "N/A"
+        job_link = card.get('href')
+        if job_link and not job_link.startswith('http'):
+            job_link = self.base_url + job_link
         
-        # Location
-        try:
-            location_elem = card.find_element(By.CLASS_NAME, "locWdth")
-            job_data['location'] = location_elem.text.strip()
-        except NoSuchElementException:
-            job_data['location'] = "N/A"
+        job_data['job_details_url'] = job_link
         
-        # Posted Date
-        try:
-            date_elem = card.find_element(By.CLASS_NAME, "job-post-day")
-            job_data['posted_date'] = date_elem.text.strip()
-        except NoSuchElementException:
-            job_data['posted_date'] = "N/A"
+        # If we didn't get job_id from attribute, try from link
+        if job_data['job_id'] == 0 and job_link:
+            match = _TRAILING_DIGITS_RE.search(job_link)
+            if match:
+                job_data['job_id'] = int(match.group(1))
+        
+        # Deep scrape logic
+        if deep_scrape and job_link:
+            apply_info = (details or {}).get(job_link) or self.get_apply_link(job_link)
+            job_data['apply_link'] = apply_info['apply_link']
+            job_data['apply_type'] = apply_info['apply_type']
+            job_data['description'] = apply_info.get('full_description', 'N/A')
+        else:
+            job_data['apply_link'] = job_link
+            job_data['apply_type'] = 'naukri'
+            job_data['description'] = text('description')
+        
+        job_data['company'] = text('company')
+        job_data['experience'] = text('experience')
+        job_data['salary'] = text('salary')
+        job_data['location'] = text('location')
+        job_data['posted_date'] = text('posted')
         
         return job_data
     
-    def extract_job_cards(self, deep_scrape: bool = False, max_jobs_needed: int = None) -> List[Dict]:
+    def extract_job_cards(self, deep_scrape: bool = False, max_jobs_needed: int = None,
+                          job_cards: Optional[List[Dict]] = None) -> List[Dict]:
         """
         Extract job information from job cards on the page
         
+        All cards are read with a single execute_script call rather than one
+        WebDriver round-trip per field per card.
+        
         Args:
             deep_scrape (bool): If True, visit each job page to get apply link
             max_jobs_needed (int): Maximum number of jobs to extract
+            job_cards (List[Dict]): Cards already read without the browser
+                (see _http_fetch_page); the current page is snapshotted if None
             
         Returns:
             List[Dict]: List of job dictionaries
@@ -398,34 +1136,296 @@ class NaukriScraper:
         jobs = []
         
         try:
-            wait = WebDriverWait(self.driver, 10)
-            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".srp-jobtuple-wrapper, .cust-job-tuple")))
+            if job_cards is None:
+                self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".srp-jobtuple-wrapper, .cust-job-tuple")))
+                job_cards = self.driver.execute_script(JOB_CARDS_SCRIPT, max_jobs_needed)
+            self.logger.info("Found %s job listings", len(job_cards))
             
-            job_cards = self.driver.find_elements(By.CSS_SELECTOR, ".srp-jobtuple-wrapper, .cust-job-tuple")
-            self.logger.info(f"Found {len(job_cards)} job listings")
+            # Deep scrape: try all detail pages over HTTP at once first; the
+            # misses are loaded in parallel browsers (or one by one in a tab)
+            details = {}
+            if deep_scrape:
+                wanted = job_cards[:max_jobs_needed] if max_jobs_needed else job_cards
+                urls = [c['href'] for c in wanted if c.get('href')]
+                details = self.fetch_job_details(urls)
+                if self.detail_workers > 1:
+                    details.update(self.fetch_job_details_in_browsers([u for u in urls if u not in details]))
             
             for idx, card in enumerate(job_cards, 1):
                 if max_jobs_needed and len(jobs) >= max_jobs_needed:
-                    self.logger.info(f"Reached max jobs limit ({max_jobs_needed}), stopping extraction")
+                    self.logger.info("Reached max jobs limit (%s), stopping extraction", max_jobs_needed)
                     break
                 
                 try:
-                    job_info = self.extract_job_info(card, idx, deep_scrape=deep_scrape)
+                    job_info = self.extract_job_info(card, idx, deep_scrape=deep_scrape, details=details)
                     if job_info:
                         jobs.append(job_info)
-                        if deep_scrape:
-                            self.logger.info(f"Job {len(jobs)}: {job_info['title']} - Apply type: {job_info['apply_type']}")
+                        if self._ndjson_fp:
+                            self._ndjson_fp.write(_ndjson_line(job_info))
+                        if deep_scrape and self.logger.isEnabledFor(logging.DEBUG):
+                            self.logger.debug("Job %s: %s - Apply type: %s", len(jobs), job_info['title'], job_info['apply_type'])
                 except Exception as e:
-                    self.logger.warning(f"Error extracting job {idx}: {str(e)}")
+                    self.logger.warning("Error extracting job %s: %s", idx, e)
                     continue
             
         except TimeoutException:
             self.logger.error("Timeout waiting for job listings to load")
         except Exception as e:
-            self.logger.error(f"Error extracting job cards: {str(e)}")
+            self.logger.error("Error extracting job cards: %s", e)
         
         return jobs
     
+    def _sort_applied(self, sort_by: str) -> bool:
+        """Whether the results page's 'Sort by' label already shows sort_by (True if there is no label)"""
+        try:
+            label = self.driver.execute_script(SORT_LABEL_SCRIPT)
+        except Exception:
+            return True
+        # Compare the selected value exactly; a substring test would also
+        # match e.g. "Updated" for 'date'
+        return not label or _selected_sort(label) == sort_by
+    
+    def _apply_ui_sort(self, sort_by: str):
+        """Switch the results sort to 'date' or 'relevance' through the 'Sort by' dropdown"""
+        try:
+            sort_option_name = 'Date' if sort_by == 'date' else 'Relevance'
+            self.logger.info("Attempting to switch sort to '%s' via UI...", sort_option_name)
+            print(f"⚡ Trying to click 'Sort by' dropdown...")
+            
+            # find_elements returns [] instead of raising, so a miss costs nothing
+            sort_xpath = "//*[contains(text(), 'Sort by')]"
+            sort_button = (self.driver.find_elements(By.XPATH, sort_xpath)
+                           or self.driver.find_elements(By.CSS_SELECTOR, ".sort-droopdown, .sort-label")
+                           or [None])[0]
+                
+            if sort_button:
+                self.driver.execute_script("arguments[0].style.border='3px solid red'", sort_button)
+                self.driver.execute_script("arguments[0].click();", sort_button)
+                try:
+                    self.wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, 'ul.dropdown li')))
+                except TimeoutException:
+                    self.logger.debug("Sort dropdown did not open in time")
+                
+                print(f"⚡ Looking for '{sort_option_name}' option...")
+                # Find by text (Date or Relevance); fallback: Date is usually 2nd item, Relevance is 1st
+                option_xpath = f"//li//*[contains(text(), '{sort_option_name}')] | //a[contains(text(), '{sort_option_name}')]"
+                nth_child = "2" if sort_by == 'date' else "1"
+                sort_option = (self.driver.find_elements(By.XPATH, option_xpath)
+                               or self.driver.find_elements(By.CSS_SELECTOR, f"ul.dropdown li:nth-child({nth_child})")
+                               or [None])[0]
+                    
+                if sort_option:
+                    self.driver.execute_script("arguments[0].style.backgroundColor='yellow'", sort_option)
+                    first_card = self.driver.find_elements(By.CSS_SELECTOR, ".srp-jobtuple-wrapper, .cust-job-tuple")[:1]
+                    self.driver.execute_script("arguments[0].click();", sort_option)
+                    print(f"✓ Clicked '{sort_option_name}' option!")
+                    # Re-sorting replaces the job cards; wait for the old ones to go
+                    if first_card:
+                        try:
+                            self.wait.until(EC.staleness_of(first_card[0]))
+                        except TimeoutException:
+                            self.logger.debug("Job cards did not refresh after sorting")
+                else:
+                    print(f"✗ Could not find '{sort_option_name}' option to click")
+                    
+        except Exception as e:
+            print(f"⚠ UI Sort failed: {str(e)}")
+            self.logger.warning("UI Sort failed: %s", e)
+    
+    def _scrape_page(self, search_url: str, page: int, jobs_remaining: int,
+                     deep_scrape: bool = False, sort_by: str = "date") -> List[Dict]:
+        """
+        Load one results page, check its sort on page 1, scroll and extract its jobs
+        
+        The page's server-rendered HTML is tried first, with no JavaScript run
+        at all; Chrome (with JavaScript) is only used if the cards aren't in it.
+        
+        Args:
+            search_url (str): Results page URL
+            page (int): Page number (the sort label is only checked on page 1 in Chrome)
+            jobs_remaining (int): Maximum number of jobs to extract from this page
+            deep_scrape (bool): If True, visit each job to extract apply link
+            sort_by (str): Sort option - 'date' or 'relevance'
+            
+        Returns:
+            List[Dict]: Jobs extracted from the page
+        """
+        self.logger.info("Accessing URL: %s", search_url)
+        
+        # The sort is in the URL, so every page (including the first) can be
+        # read from the plain HTML; only render in Chrome if that fails
+        if self._html_pages:
+            job_cards = self._http_fetch_page(search_url)
+            if job_cards:
+                return self.extract_job_cards(deep_scrape=deep_scrape, max_jobs_needed=jobs_remaining,
+                                              job_cards=job_cards)
+            # Cards are rendered client-side; don't download the HTML of later pages
+            self._html_pages = False
+        
+        self.driver.get(search_url)
+        return self._harvest_page(page, jobs_remaining, deep_scrape, sort_by)
+    
+    def _harvest_page(self, page: int, jobs_remaining: int,
+                      deep_scrape: bool = False, sort_by: str = "date") -> List[Dict]:
+        """Wait for the results page in the current tab to settle, then scroll and extract its jobs"""
+        # Let the page signal when its job cards have stopped changing
+        self.driver.execute_script(CARDS_STABLE_SCRIPT)
+        try:
+            self.wait.until(
+                lambda d: d.execute_script("return window.__naukri_stable === true;")
+            )
+        except TimeoutException:
+            self.logger.warning("No job cards appeared after page load")
+        
+        # The sort is requested in the URL; only drive the dropdown if the
+        # page's sort label shows the parameter was ignored
+        if page == 1 and sort_by in ['date', 'relevance'] and not self._sort_applied(sort_by):
+            self._apply_ui_sort(sort_by)
+        
+        # Dynamic scrolling - only scroll until we have enough jobs for THIS page
+        current_job_count = 0
+        scrolls = 0
+        max_scrolls_limit = min(5, (jobs_remaining // 5) + 2)  # Adaptive scroll limit
+        
+        while current_job_count < jobs_remaining and scrolls < max_scrolls_limit:
+            # Count and scroll in one round trip
+            current_job_count, prev_height = self.driver.execute_script(SCROLL_STEP_SCRIPT, jobs_remaining)
+            
+            if current_job_count >= jobs_remaining:
+                self.logger.info("Found enough jobs (%s >= %s), stopping scroll.", current_job_count, jobs_remaining)
+                break
+                
+            scrolls += 1
+            self.logger.info("Scrolled %s times, found %s jobs so far...", scrolls, current_job_count)
+            
+            # Wait (up to 2s) for the page to grow instead of a fixed sleep;
+            # if nothing new loads, there is no point scrolling again
+            try:
+                WebDriverWait(self.driver, 2, poll_frequency=0.15).until(
+                    lambda d: d.execute_script("return document.body.scrollHeight;") > prev_height
+                )
+            except TimeoutException:
+                self.logger.info("No new content after scrolling, stopping scroll.")
+                break
+        
+        jobs = self.extract_job_cards(deep_scrape=deep_scrape, max_jobs_needed=jobs_remaining)
+        self._purge_js_memory()
+        return jobs
+    
+    def _purge_js_memory(self):
+        """Force a V8 garbage collection in the page so renderer memory stays flat across pages"""
+        try:
+            self.driver.execute_cdp_cmd('Memory.forciblyPurgeJavaScriptMemory', {})
+        except Exception as e:
+            self.logger.debug("Could not purge JavaScript memory: %s", e)
+    
+    def _scrape_pages_in_tabs(self, page_url, max_jobs: int, deep_scrape: bool,
+                              sort_by: str, tabs: int) -> List[Dict]:
+        """
+        Scrape result pages by loading several at once in background tabs
+        
+        Each batch of `tabs` pages is opened with CDP Target.createTarget and,
+        once the tab's URL blocking is set, started with Page.navigate (which
+        doesn't wait for the load), so Chrome fetches and renders them
+        concurrently; the tabs are then harvested one by one (by then they are
+        usually already loaded) and closed. Stops at the first page without jobs.
+        """
+        pages = list(range(1, math.ceil(max_jobs / JOBS_PER_PAGE) + 1))
+        self.logger.info("Scraping %s pages, %s tabs at a time", len(pages), tabs)
+        print(f"⚡ Scraping {len(pages)} pages, {tabs} tabs at a time...")
+        
+        original_window = self.driver.current_window_handle
+        all_jobs = []
+        done = False
+        for start in range(0, len(pages), tabs):
+            batch = pages[start:start + tabs]
+            
+            # ChromeDriver window handles are the tabs' CDP target ids
+            handles = []
+            try:
+                for p in batch:
+                    handle = self.driver.execute_cdp_cmd('Target.createTarget',
+                                                         {'url': 'about:blank', 'background': True})['targetId']
+                    handles.append(handle)
+                    self.driver.switch_to.window(handle)
+                    self._block_urls(self.driver)
+                    self.driver.execute_cdp_cmd('Page.navigate', {'url': page_url(p)})
+            finally:
+                self.driver.switch_to.window(original_window)
+            
+            for page, handle in zip(batch, handles):
+                if not done:
+                    try:
+                        self.driver.switch_to.window(handle)
+                        page_jobs = self._harvest_page(page, max_jobs - len(all_jobs), deep_scrape, sort_by)
+                    except Exception as e:
+                        self.logger.error("Error scraping page %s: %s", page, e)
+                        page_jobs = []
+                    finally:
+                        self.driver.switch_to.window(original_window)
+                    
+                    all_jobs.extend(page_jobs)
+                    print(f"✓ Collected {len(all_jobs)}/{max_jobs} jobs")
+                    done = not page_jobs or len(all_jobs) >= max_jobs
+                
+                try:
+                    self.driver.execute_cdp_cmd('Target.closeTarget', {'targetId': handle})
+                except Exception as e:
+                    self.logger.debug("Could not close tab for page %s: %s", page, e)
+            
+            if done:
+                break
+        
+        return all_jobs[:max_jobs]
+    
+    def _scrape_pages_parallel(self, page_url, max_jobs: int, deep_scrape: bool,
+                               sort_by: str, workers: int) -> Optional[List[Dict]]:
+        """
+        Scrape the result pages needed for max_jobs in separate processes
+        
+        Each worker process runs its own headless Chrome (see
+        _init_page_worker); pages are independent, so they are fetched
+        concurrently and merged back in page order. Returns None if the
+        pool couldn't start or a worker died, so the caller can scrape the
+        pages in this process instead.
+        """
+        pages = list(range(1, math.ceil(max_jobs / JOBS_PER_PAGE) + 1))
+        workers = min(workers, len(pages))
+        self.logger.info("Scraping %s pages with %s worker processes", len(pages), workers)
+        print(f"⚡ Scraping {len(pages)} pages with {workers} parallel browsers...")
+        
+        from logging.handlers import QueueListener
+        
+        # Workers send their log records here and this process writes them,
+        # so only one process owns (and rotates) naukri_scraper.log
+        ctx = multiprocessing.get_context('spawn')
+        log_queue = ctx.Queue(-1)
+        handlers = _log_listener.handlers if _log_listener else logging.getLogger().handlers
+        log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        log_listener.start()
+        
+        # Worker browsers are always headless; a window per process is no use to anyone
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                                     initializer=_init_page_worker, initargs=(True, log_queue)) as executor:
+                results = executor.map(_scrape_page_worker, [page_url(p) for p in pages], pages,
+                                       [JOBS_PER_PAGE] * len(pages), [deep_scrape] * len(pages),
+                                       [sort_by] * len(pages))
+                all_jobs = [job for page_jobs in results for job in page_jobs][:max_jobs]
+        except (BrokenProcessPool, OSError) as e:
+            self.logger.error("Page worker processes failed, scraping pages in this browser: %s", e)
+            print("⚠ Parallel browsers failed, falling back to one page at a time")
+            return None
+        finally:
+            log_listener.stop()
+        
+        if self._ndjson_fp:
+            for job in all_jobs:
+                self._ndjson_fp.write(_ndjson_line(job))
+        
+        print(f"✓ Collected {len(all_jobs)}/{max_jobs} jobs")
+        return all_jobs
+    
     def scrape_jobs(self, 
                    keyword: str, 
                    location: str = "",
@@ -433,9 +1433,12 @@ class NaukriScraper:
                    max_jobs: int = 100,
                    deep_scrape: bool = False,
                    sort_by: str = "date",
-                   freshness: int = 1) -> List[Dict]:
+                   freshness: int = 1,
+                   workers: int = 1,
+                   mode: str = "selenium",
+                   tabs: int = 1) -> List[Dict]:
         """
-        Main scraping function with auto-pagination and UI sorting
+        Main scraping function with auto-pagination and sorting
         
         Args:
             keyword (str): Job search keyword
@@ -445,6 +1448,13 @@ class NaukriScraper:
             deep_scrape (bool): If True, visit each job to extract apply link
             sort_by (str): Sort option - 'date' or 'relevance' (default: 'date')
             freshness (int): Filter jobs posted within last N days (1, 3, 7, 15, 30)
+            workers (int): If > 1, scrape result pages in parallel with this many
+                headless browser processes instead of one page at a time (not
+                possible from a daemon process; tabs or sequential pages are used)
+            mode (str): 'api' to try Naukri's JSON jobs API first (falling back to
+                the browser if it is refused), or 'selenium' (default)
+            tabs (int): If > 1 (and workers is 1), load this many result pages at
+                once in background tabs of the one browser
             
         Returns:
             List[Dict]: List of scraped jobs
@@ -455,146 +1465,75 @@ class NaukriScraper:
         
         all_jobs = []
         page = 1
+        self._html_pages = True
         
-        while len(all_jobs) < max_jobs:
-            self.logger.info(f"Scraping page {page} (collected {len(all_jobs)}/{max_jobs} jobs so far)")
-            print(f"📄 Page {page}: {len(all_jobs)}/{max_jobs} jobs collected so far...")
-            
-            search_url = self.build_search_url(keyword, location, experience, freshness=freshness)
-            if page > 1:
-                search_url += f"&page={page}" if "?" in search_url else f"?page={page}"
-            
-            self.logger.info(f"Accessing URL: {search_url}")
-            
-            try:
-                self.driver.get(search_url)
-                time.sleep(3)
-                
-                # UI SORTING LOGIC
-                if page == 1 and sort_by in ['date', 'relevance']:
-                    try:
-                        sort_option_name = 'Date' if sort_by == 'date' else 'Relevance'
-                        self.logger.info(f"Attempting to switch sort to '{sort_option_name}' via UI...")
-                        print(f"⚡ Trying to click 'Sort by' dropdown...")
-                        
-                        sort_button = None
-                        try:
-                            sort_xpath = "//*[contains(text(), 'Sort by')]"
-                            sort_button = self.driver.find_element(By.XPATH, sort_xpath)
-                        except:
-                            sort_button = self.driver.find_element(By.CSS_SELECTOR, ".sort-droopdown, .sort-label")
-                            
-                        if sort_button:
-                            self.driver.execute_script("arguments[0].style.border='3px solid red'", sort_button)
-                            time.sleep(1)
-                            self.driver.execute_script("arguments[0].click();", sort_button)
-                            time.sleep(2)
-                            
-                            print(f"⚡ Looking for '{sort_option_name}' option...")
-                            sort_option = None
-                            try:
-                                # Try to find by text (Date or Relevance)
-                                option_xpath = f"//li//*[contains(text(), '{sort_option_name}')] | //a[contains(text(), '{sort_option_name}')]"
-                                sort_option = self.driver.find_element(By.XPATH, option_xpath)
-                            except:
-                                # Fallback: Date is usually 2nd item, Relevance is 1st
-                                nth_child = "2" if sort_by == 'date' else "1"
-                                sort_option = self.driver.find_element(By.CSS_SELECTOR, f"ul.dropdown li:nth-child({nth_child})")
-                                
-                            if sort_option:
-                                self.driver.execute_script("arguments[0].style.backgroundColor='yellow'", sort_option)
-                                time.sleep(1)
-                                self.driver.execute_script("arguments[0].click();", sort_option)
-                                print(f"✓ Clicked '{sort_option_name}' option!")
-                                time.sleep(3)
-                            else:
-                                print(f"✗ Could not find '{sort_option_name}' option to click")
-                                
-                    except Exception as e:
-                        print(f"⚠ UI Sort failed: {str(e)}")
-                        self.logger.warning(f"UI Sort failed: {e}")
-                
-                
-                # Calculate how many jobs we still need
-                jobs_remaining = max_jobs - len(all_jobs)
+        first_page_url = self.build_search_url(keyword, location, experience,
+                                               freshness=freshness, sort_by=sort_by)
+        
+        def page_url(page: int) -> str:
+            return f"{first_page_url}&page={page}" if page > 1 else first_page_url
+        
+        if mode == 'api':
+            all_jobs = self.scrape_via_api(keyword, location, experience, max_jobs,
+                                           deep_scrape=deep_scrape, freshness=freshness,
+                                           sort_by=sort_by)
+            if all_jobs:
+                print(f"✓ Collected {len(all_jobs)}/{max_jobs} jobs from the jobs API")
+            else:
+                self.logger.warning("Jobs API returned no results, falling back to the browser")
+                print("⚠ Jobs API unavailable, falling back to browser scraping")
+        
+        parallel_jobs = None
+        if not all_jobs and workers > 1:
+            if multiprocessing.current_process().daemon:
+                # e.g. the web app's scrape worker: daemon processes can't have children
+                self.logger.warning("Running in a daemon process, scraping pages without worker processes")
+            else:
+                parallel_jobs = self._scrape_pages_parallel(page_url, max_jobs, deep_scrape, sort_by, workers)
+        
+        if parallel_jobs is not None:
+            all_jobs = parallel_jobs
+        elif not all_jobs and tabs > 1:
+            all_jobs = self._scrape_pages_in_tabs(page_url, max_jobs, deep_scrape, sort_by, tabs)
+        elif not all_jobs:
+            while len(all_jobs) < max_jobs:
+                self.logger.info("Scraping page %s (collected %s/%s jobs so far)", page, len(all_jobs), max_jobs)
+                print(f"📄 Page {page}: {len(all_jobs)}/{max_jobs} jobs collected so far...")
                 
-                # Dynamic scrolling - only scroll until we have enough jobs for THIS page
-                current_job_count = 0
-                scrolls = 0
-                max_scrolls_limit = min(5, (jobs_remaining // 5) + 2)  # Adaptive scroll limit
+                url = page_url(page)
                 
-                while current_job_count < jobs_remaining and scrolls < max_scrolls_limit:
-                    job_cards = self.driver.find_elements(By.CSS_SELECTOR, ".srp-jobtuple-wrapper, .cust-job-tuple")
-                    current_job_count = len(job_cards)
+                try:
+                    page_jobs = self._scrape_page(url, page, max_jobs - len(all_jobs), deep_scrape, sort_by)
                     
-                    if current_job_count >= jobs_remaining:
-                        self.logger.info(f"Found enough jobs ({current_job_count} >= {jobs_remaining}), stopping scroll.")
+                    if not page_jobs:
+                        self.logger.info("No more jobs found, stopping pagination")
+                        print("✓ No more jobs available")
                         break
-                        
-                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(2)
-                    scrolls += 1
-                    self.logger.info(f"Scrolled {scrolls} times, found {current_job_count} jobs so far...")
-                
-                page_jobs = self.extract_job_cards(deep_scrape=deep_scrape, max_jobs_needed=jobs_remaining)
-                
-                if not page_jobs:
-                    self.logger.info("No more jobs found, stopping pagination")
-                    print("✓ No more jobs available")
-                    break
-                
-                all_jobs.extend(page_jobs)
-                
-                self.logger.info(f"Extracted {len(page_jobs)} jobs from page {page}, total now: {len(all_jobs)}")
-                print(f"✓ Collected {len(all_jobs)}/{max_jobs} jobs")
+                    
+                    all_jobs.extend(page_jobs)
+                    
+                    self.logger.info("Extracted %s jobs from page %s, total now: %s", len(page_jobs), page, len(all_jobs))
+                    print(f"✓ Collected {len(all_jobs)}/{max_jobs} jobs")
+                    
+                    if len(all_jobs) >= max_jobs:
+                        self.logger.info("Reached max_jobs limit (%s)", max_jobs)
+                        print(f"✓ Collected maximum {max_jobs} jobs!")
+                        break
+                    
+                    page += 1
                 
-                if len(all_jobs) >= max_jobs:
-                    self.logger.info(f"Reached max_jobs limit ({max_jobs})")
-                    print(f"✓ Collected maximum {max_jobs} jobs!")
+                except Exception as e:
+                    self.logger.error("Error scraping page %s: %s", page, e)
                     break
-                
-                page += 1
-                time.sleep(2)
-                    
-            except Exception as e:
-                self.logger.error(f"Error scraping page {page}: {str(e)}")
-                break
-        
-        # Local Sorting Logic
-        def parse_date_for_sorting(job):
-            posted = job.get('posted_date', '').lower()
-            job_id = job.get('job_id', 0)
-            days_ago = 999
-            
-            if not posted or posted == 'n/a':
-                days_ago = 999
-            elif 'just now' in posted:
-                days_ago = -0.2
-            elif 'few hours' in posted:
-                days_ago = -0.1
-            elif 'today' in posted:
-                days_ago = 0
-            elif 'hour' in posted:
-                days_ago = 0
-            elif 'day' in posted:
-                try:
-                    match = re.search(r'(\d+)', posted)
-                    days_ago = int(match.group(1)) if match else 1
-                except:
-                    days_ago = 1
-            elif 'week' in posted:
-                try:
-                    match = re.search(r'(\d+)', posted)
-                    days_ago = int(match.group(1)) * 7 if match else 7
-                except:
-                    days_ago = 7
-            elif 'month' in posted:
-                days_ago = 30
-            
-            return (days_ago, -job_id)
-        
-        all_jobs.sort(key=parse_date_for_sorting)
-        self.logger.info(f"Sorted {len(all_jobs)} jobs by recency (newest first)")
+
+        # Local Sorting Logic: newest first, then highest job id. Each posted
+        # date is parsed once into a (days, job) pair kept outside the job dicts,
+        # then two stable C-level sorts replace a Python key function
+        all_jobs.sort(key=itemgetter('job_id'), reverse=True)
+        by_age = [(_parse_days_ago(job['posted_date']), job) for job in all_jobs]
+        by_age.sort(key=itemgetter(0))
+        all_jobs = [job for _, job in by_age]
+        self.logger.info("Sorted %s jobs by recency (newest first)", len(all_jobs))
         
         print("\n" + "="*80)
         print(f"FINAL SORTED LIST ({len(all_jobs)} jobs)")
@@ -608,8 +1547,14 @@ class NaukriScraper:
         self.jobs_data = all_jobs
         return all_jobs
     
-    def save_to_json(self, filename: str = None):
-        """Save scraped jobs to JSON file"""
+    def save_to_json(self, filename: str = None, pretty: bool = False):
+        """
+        Save scraped jobs to JSON file
+        
+        Args:
+            filename (str): Output filename (timestamped if None)
+            pretty (bool): Indent the output for reading; compact is smaller and faster to write
+        """
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"naukri_jobs_{timestamp}.json"
@@ -626,17 +1571,164 @@ class NaukriScraper:
             'jobs': self.jobs_data
         }
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        # Serialize to memory first (json.dump issues one write() per token)
+        payload = _encode_output(output_data, pretty)
+        with open(filename, 'wb', buffering=65536) as f:
+            f.write(payload)
         
-        self.logger.info(f"Saved {len(self.jobs_data)} jobs to {filename}")
+        self.logger.info("Saved %s jobs to %s", len(self.jobs_data), filename)
         print(f"\n✓ Successfully saved {len(self.jobs_data)} jobs to '{filename}'")
     
+    def reset(self):
+        """Clear cookies, site storage and the current page so the browser can be reused for another scrape"""
+        self.jobs_data = []
+        self.driver.delete_all_cookies()
+        if self._http_session:
+            self._http_session.cookie_jar.clear()
+        try:
+            self.driver.execute_cdp_cmd('Storage.clearDataForOrigin', {
+                'origin': self.base_url,
+                'storageTypes': 'all'
+            })
+        except Exception as e:
+            self.logger.debug("Could not clear site storage: %s", e)
+        self.driver.get('about:blank')
+    
     def close(self):
         """Close the browser and cleanup"""
+        if self._browser_pool:
+            self._browser_pool.close()
+            self._browser_pool = None
+        if self._http_loop:
+            if self._http_session:
+                self._http_loop.run_until_complete(self._http_session.close())
+                self._http_session = None
+            self._http_loop.close()
+            self._http_loop = None
         if self.driver:
             self.driver.quit()
             self.logger.info("Browser closed")
+        if self._ndjson_fp:
+            self._ndjson_fp.close()
+            self._ndjson_fp = None
+
+
+# Scraper owned by a page worker process (see NaukriScraper._scrape_pages_parallel)
+_page_worker_scraper = None
+
+
+def _init_page_worker(headless: bool, log_queue):
+    """Start the browser a page worker process reuses for all of its pages"""
+    from logging.handlers import QueueHandler
+    
+    global _page_worker_scraper
+    # Log through the parent process (setup_logging then leaves the root logger alone)
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(QueueHandler(log_queue))
+    # Pages already run in parallel across workers; one browser each is enough
+    _page_worker_scraper = NaukriScraper(headless=headless, detail_workers=1)
+    # Pool workers skip atexit handlers; multiprocessing finalizers still run
+    multiprocessing.util.Finalize(_page_worker_scraper, _page_worker_scraper.close, exitpriority=10)
+
+
+def _scrape_page_worker(search_url: str, page: int, jobs_remaining: int,
+                        deep_scrape: bool, sort_by: str) -> List[Dict]:
+    """Scrape one results page in a worker process; a failed page yields no jobs"""
+    try:
+        return _page_worker_scraper._scrape_page(search_url, page, jobs_remaining, deep_scrape, sort_by)
+    except Exception as e:
+        _page_worker_scraper.logger.error("Error scraping page %s: %s", page, e)
+        return []
+
+
+def _parse_job_cards(body: bytes, page_url: str) -> List[Dict]:
+    """
+    Read the job cards out of a results page's HTML
+    
+    Uses selectolax's C parser when installed, lxml otherwise. Returns the same
+    dicts as JOB_CARDS_SCRIPT, with links made absolute against page_url.
+    """
+    _import_http()
+    cards = []
+    if LexborHTMLParser is not None:
+        for card in LexborHTMLParser(body).css(_CARD_SELECTOR):
+            title = card.css_first('a.title')
+            info = {
+                'jobId': card.attributes.get('data-job-id'),
+                'tupleId': card.attributes.get('id'),
+                'title': title.text() if title else None,
+                'href': urljoin(page_url, title.attributes.get('href')) if title else None,
+            }
+            for key, selector in _CARD_FIELD_SELECTORS.items():
+                found = card.css_first(selector)
+                info[key] = found.text() if found else None
+            cards.append(info)
+        return cards
+    
+    for card in _CARD_XPATH(lxml_html.fromstring(body)):
+        title = _CARD_TITLE_XPATH(card)
+        info = {
+            'jobId': card.get('data-job-id'),
+            'tupleId': card.get('id'),
+            'title': title[0].text_content() if title else None,
+            'href': urljoin(page_url, title[0].get('href')) if title else None,
+        }
+        for key, xpath in _CARD_FIELD_XPATHS.items():
+            found = xpath(card)
+            info[key] = found[0].text_content() if found else None
+        cards.append(info)
+    return cards
+
+
+def _ndjson_line(obj) -> bytes:
+    """One compact UTF-8 JSON line, via orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8') + b'\n'
+
+
+def _encode_output(obj, pretty: bool = False) -> bytes:
+    """UTF-8 JSON for an output file, via orjson when available; indented if pretty"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def convert_ndjson_to_json(path: str, filename: str = None, pretty: bool = False) -> str:
+    """
+    Consolidate an NDJSON file written during scraping into the regular output format
+    
+    Args:
+        path (str): NDJSON file (one job per line)
+        filename (str): Output JSON filename (defaults to path with a .json extension)
+        pretty (bool): Indent the output for reading
+        
+    Returns:
+        str: The output filename
+    """
+    if not filename:
+        filename = re.sub(r'\.ndjson$', '', path) + '.json'
+    
+    loads = orjson.loads if orjson is not None else json.loads
+    with open(path, 'rb') as f:
+        jobs = [loads(line) for line in f if line.strip()]
+    
+    output_data = {
+        'metadata': {
+            'total_jobs': len(jobs),
+            'scraped_at': datetime.now().isoformat(),
+            'source': 'Naukri.com'
+        },
+        'jobs': jobs
+    }
+    
+    with open(filename, 'wb', buffering=65536) as f:
+        f.write(_encode_output(output_data, pretty))
+    
+    return filename
 
 
 def main():
@@ -647,10 +1739,16 @@ def main():
     parser.add_argument('--experience', '-e', type=int, default=0, help='Experience in years (e.g., 4 for 4 years)')
     parser.add_argument('--max-jobs', '-m', type=int, default=100, help='Maximum jobs to scrape (default: 100)')
     parser.add_argument('--output', '-o', help='Output JSON filename')
+    parser.add_argument('--pretty', action='store_true', help='Indent the output JSON (default: compact)')
     parser.add_argument('--headless', action='store_true', help='Run browser in headless mode')
     parser.add_argument('--deep-scrape', action='store_true', help='Visit each job to extract description')
     parser.add_argument('--sort-by', '-s', choices=['date', 'relevance'], default='date', help='Sort by date or relevance (default: date)')
     parser.add_argument('--freshness', '-f', type=int, choices=[1, 3, 7, 15, 30], default=1, help='Jobs posted within last N days (1, 3, 7, 15, 30)')
+    parser.add_argument('--ndjson', help='Also append each job to this NDJSON file as it is scraped')
+    parser.add_argument('--mode', choices=['api', 'selenium'], default='selenium', help="Try Naukri's JSON jobs API first, or scrape with the browser only (default: selenium)")
+    parser.add_argument('--tabs', type=int, default=1, help='Load N result pages at once in background tabs of one browser (default: 1)')
+    parser.add_argument('--workers', '-w', type=int, default=1, help='Scrape result pages in parallel with N browsers (default: 1)')
+    parser.add_argument('--detail-workers', type=int, default=1, help='With --deep-scrape, load job pages in N parallel headless browsers (default: 1, a tab in the main browser)')
     
     args = parser.parse_args()
     
@@ -666,7 +1764,8 @@ def main():
     print(f"Deep Scrape: {'Yes' if args.deep_scrape else 'No'}")
     print("=" * 70)
     
-    scraper = NaukriScraper(headless=args.headless)
+    scraper = NaukriScraper(headless=args.headless, ndjson_path=args.ndjson,
+                            detail_workers=args.detail_workers)
     
     try:
         jobs = scraper.scrape_jobs(
@@ -676,11 +1775,14 @@ def main():
             max_jobs=args.max_jobs,
             deep_scrape=args.deep_scrape,
             sort_by=args.sort_by,
-            freshness=args.freshness
+            freshness=args.freshness,
+            workers=args.workers,
+            mode=args.mode,
+            tabs=args.tabs
         )
         
         if jobs:
-            scraper.save_to_json(args.output)
+            scraper.save_to_json(args.output, pretty=args.pretty)
         else:
             print("\nNo jobs found matching criteria.")
             
@@ -0,0 +1,69 @@
+import io
+import logging
+import unittest
+from contextlib import redirect_stdout
+
+from naukri_scraper import NaukriScraper
+
+
+class BuildSearchUrlTest(unittest.TestCase):
+    """Search URLs match the format the hand-built query string produced"""
+
+    def test_full_search(self):
+        self.assertEqual(
+            NaukriScraper.build_search_url('Python Developer', 'Pune', 3, freshness=7, sort_by='date'),
+            'https://www.naukri.com/python-developer-jobs-in-pune'
+            '?k=python%20developer&l=pune&experience=3&jobAge=7&sort=f')
+
+    def test_keyword_only(self):
+        self.assertEqual(
+            NaukriScraper.build_search_url('Java'),
+            'https://www.naukri.com/java-jobs?k=java&jobAge=1')
+
+    def test_comma_separated_values(self):
+        self.assertEqual(
+            NaukriScraper.build_search_url('data analyst, python', 'Delhi, Noida', freshness=3),
+            'https://www.naukri.com/data-analyst,-python-jobs-in-delhi,-noida'
+            '?k=data%20analyst%2C%20python&l=delhi%2C%20noida&jobAge=3')
+
+    def test_unset_and_invalid_params_are_dropped(self):
+        self.assertEqual(
+            NaukriScraper.build_search_url('QA', experience=0, freshness=2, sort_by=None),
+            'https://www.naukri.com/qa-jobs?k=qa')
+
+    def test_salary_and_relevance_sort(self):
+        self.assertEqual(
+            NaukriScraper.build_search_url('Go', salary='3-6', freshness=30, sort_by='relevance'),
+            'https://www.naukri.com/go-jobs?k=go&jobAge=30&salary=3-6&sort=r')
+
+    def test_cached_per_search(self):
+        first = NaukriScraper.build_search_url('Rust', 'Chennai', 2, freshness=15)
+        hits = NaukriScraper.build_search_url.cache_info().hits
+        self.assertIs(NaukriScraper.build_search_url('Rust', 'Chennai', 2, freshness=15), first)
+        self.assertEqual(NaukriScraper.build_search_url.cache_info().hits, hits + 1)
+
+
+
+class ScrapeJobsPageUrlTest(unittest.TestCase):
+    """Each results page is requested as the first page's URL plus its own page number"""
+
+    def test_sequential_pages(self):
+        scraper = NaukriScraper.__new__(NaukriScraper)
+        scraper.logger = logging.getLogger('test')
+        requested = []
+
+        def fake_scrape_page(url, page, jobs_remaining, deep_scrape, sort_by):
+            requested.append(url)
+            return [{'job_id': page * 100 + i, 'posted_date': 'Today', 'title': 'Job'} for i in range(20)]
+
+        scraper._scrape_page = fake_scrape_page
+        with redirect_stdout(io.StringIO()):
+            jobs = scraper.scrape_jobs('Python', max_jobs=60, sort_by='date', freshness=1)
+
+        base = 'https://www.naukri.com/python-jobs?k=python&jobAge=1&sort=f'
+        self.assertEqual(requested, [base, base + '&page=2', base + '&page=3'])
+        self.assertEqual(len(jobs), 60)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+
+from naukri_scraper import _parse_days_ago
+
+
+class ParseDaysAgoTest(unittest.TestCase):
+    """Posted-date labels map to the same ages as the original if/elif chain"""
+
+    CASES = [
+        ('Just Now', -0.2),
+        ('Few Hours Ago', -0.1),
+        ('Today', 0),
+        ('5 Hours Ago', 0),
+        ('1 Day Ago', 1),
+        ('3 Days Ago', 3),
+        ('30+ Days Ago', 30),
+        ('Yesterday', 1),
+        ('1 Week Ago', 7),
+        ('2 Weeks Ago', 14),
+        ('A week ago', 7),
+        ('1 Month Ago', 30),
+        ('N/A', 999),
+        ('', 999),
+        ('Recently posted', 999),
+    ]
+
+    def test_labels(self):
+        for label, days in self.CASES:
+            with self.subTest(label=label):
+                self.assertEqual(_parse_days_ago(label), days)
+
+    def test_newest_sorts_first(self):
+        labels = ['2 Weeks Ago', 'N/A', 'Today', 'Just Now', '3 Days Ago', 'Few Hours Ago']
+        self.assertEqual(sorted(labels, key=_parse_days_ago),
+                         ['Just Now', 'Few Hours Ago', 'Today', '3 Days Ago', '2 Weeks Ago', 'N/A'])
+
+
+if __name__ == '__main__':
+    unittest.main()
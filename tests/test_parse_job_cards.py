@@ -0,0 +1,75 @@
+import unittest
+from unittest import mock
+
+import naukri_scraper
+from naukri_scraper import _parse_job_cards
+
+PAGE_URL = 'https://www.naukri.com/python-jobs?k=python&page=2'
+
+PAGE_HTML = b"""
+<html><body>
+<div class="srp-jobtuple-wrapper" data-job-id="120925012345">
+  <div class="row1"><a class="title " href="/job-listings-python-developer-acme-pune-3-to-5-years-120925012345">Python Developer</a></div>
+  <div class="row2"><a class="comp-name mw-25">Acme Corp</a></div>
+  <div class="row3">
+    <span class="expwdth">3-5 Yrs</span>
+    <span class="sal">Not disclosed</span>
+    <span class="locWdth">Pune</span>
+  </div>
+  <span class="job-desc">Build and maintain Python services</span>
+  <span class="job-post-day">3 Days Ago</span>
+</div>
+<div class="cust-job-tuple" id="jobTuple_98765">
+  <a class="title" href="https://www.naukri.com/job-listings-backend-engineer-98765">Backend Engineer</a>
+  <span class="company-name">Globex</span>
+</div>
+<div class="not-a-card"><a class="title" href="/ignored">Ignored</a></div>
+</body></html>
+"""
+
+EXPECTED = [
+    {
+        'jobId': '120925012345',
+        'tupleId': None,
+        'title': 'Python Developer',
+        'href': 'https://www.naukri.com/job-listings-python-developer-acme-pune-3-to-5-years-120925012345',
+        'company': 'Acme Corp',
+        'experience': '3-5 Yrs',
+        'salary': 'Not disclosed',
+        'location': 'Pune',
+        'posted': '3 Days Ago',
+        'description': 'Build and maintain Python services',
+    },
+    {
+        'jobId': None,
+        'tupleId': 'jobTuple_98765',
+        'title': 'Backend Engineer',
+        'href': 'https://www.naukri.com/job-listings-backend-engineer-98765',
+        'company': 'Globex',
+        'experience': None,
+        'salary': None,
+        'location': None,
+        'posted': None,
+        'description': None,
+    },
+]
+
+
+@unittest.skipUnless(naukri_scraper._import_http(), 'aiohttp/lxml not installed')
+class ParseJobCardsTest(unittest.TestCase):
+    """Cards read from page HTML match JOB_CARDS_SCRIPT's shape with either parser"""
+
+    @unittest.skipIf(naukri_scraper.LexborHTMLParser is None, 'selectolax not installed')
+    def test_selectolax(self):
+        self.assertEqual(_parse_job_cards(PAGE_HTML, PAGE_URL), EXPECTED)
+
+    def test_lxml_fallback(self):
+        with mock.patch.object(naukri_scraper, 'LexborHTMLParser', None):
+            self.assertEqual(_parse_job_cards(PAGE_HTML, PAGE_URL), EXPECTED)
+
+    def test_no_cards(self):
+        self.assertEqual(_parse_job_cards(b'<html><body><p>No jobs</p></body></html>', PAGE_URL), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,29 @@
+import unittest
+
+from naukri_scraper import _selected_sort
+
+
+class SelectedSortTest(unittest.TestCase):
+    """The selected sort is read exactly from the 'Sort by' label text"""
+
+    CASES = [
+        ('Sort by: Date', 'date'),
+        ('Sort by : Relevance', 'relevance'),
+        ('Sort by\nRelevance', 'relevance'),
+        ('Relevance', 'relevance'),
+        ('Updated 2 days ago', 'updated'),
+        ('', None),
+    ]
+
+    def test_labels(self):
+        for label, expected in self.CASES:
+            with self.subTest(label=label):
+                self.assertEqual(_selected_sort(label), expected)
+
+    def test_no_substring_match(self):
+        self.assertNotEqual(_selected_sort('Updated recently'), 'date')
+        self.assertNotEqual(_selected_sort('Sort by: Relevance (date posted)'), 'date')
+
+
+if __name__ == '__main__':
+    unittest.main()